@@ -1,17 +1,32 @@
 # main/admin.py
 from pathlib import Path
+import functools
+import operator
 import os
 from django.contrib import admin
+from django.contrib.admin.views.main import PAGE_VAR, ChangeList
+from django.core.cache import cache
 from django.apps import apps
+from django.db import connections, transaction
+from django.db.models import Q
 from django.utils.html import format_html
 from django import forms
 
-from .models import AboutImage   # ✅ About section image
+from . import cache_keys
+from .models import AboutImage, StaffRole   # ✅ About section image
+from .paginators import CachedCountPaginator, count_cache_key
 
 
 # Auto-detect the current app label (e.g., "main")
 APP_LABEL = __name__.split(".")[0]
 
+# Changelist HTML fragments, formatted once per row
+_FILE_LINK_TPL = '<a href="{}" target="_blank">Open</a>'
+_IMG_TPL = '<img src="{}" style="height:{}px;border-radius:6px;object-fit:cover;">'
+_PREVIEW_IMG_TPL = '<img src="{}" style="height:{}px;border-radius:8px;">'
+_VIDEO_FILE_TPL = '<a href="{}" target="_blank">🎬 Video File</a>'
+_VIDEO_URL_TPL = '<a href="{}" target="_blank">🔗 External</a>'
+
 
 def get_model(name):
     """Return the model class for <APP_LABEL>.<name>, or None if it doesn't exist."""
@@ -21,7 +36,9 @@ def get_model(name):
         return None
 
 
+@functools.lru_cache(maxsize=None)
 def model_has_field(model, field_name: str) -> bool:
+    """Cached per (model, field_name); model classes are stable for the life of the process."""
     try:
         model._meta.get_field(field_name)
         return True
@@ -29,9 +46,67 @@ def model_has_field(model, field_name: str) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=None)
+def model_field_names(model) -> tuple:
+    """Concrete field names of `model` (excluding the auto `id`), computed once per process."""
+    return tuple(f.name for f in model._meta.fields if f.name != "id")
+
+
+def _singleton_exists(model, cache_key) -> bool:
+    """Cached `model.objects.exists()`; main.signals clears the key on save/delete.
+
+    Relies on the shared default cache (settings.CACHES), so a clear in one worker is
+    seen by every worker's add-permission check.
+    """
+    exists = cache.get(cache_key)
+    if exists is None:
+        exists = model.objects.exists()
+        cache.set(cache_key, exists, 3600)
+    return exists
+
+
+def _chunked_update(queryset, field, value, chunk=10000):
+    """UPDATE `field` on the selected rows in pk batches so large selections don't hold long locks.
+
+    The batch is capped at the backend's bind-parameter limit (999 on SQLite). Returns rows updated.
+    """
+    max_params = connections[queryset.db].features.max_query_params
+    if max_params:
+        chunk = min(chunk, max_params)
+    pks = list(queryset.values_list("pk", flat=True))
+    updated = 0
+    for i in range(0, len(pks), chunk):
+        updated += queryset.model.objects.filter(pk__in=pks[i:i + chunk]).update(**{field: value})
+    return updated
+
+
+# Each admin `ordering` below is backed by a matching Meta.indexes entry in models.py:
+#   ClassTimetable  ("-created_at", "course", "semester")   -> timetable_cl_idx
+#   Slider          ("-created_at",)                        -> slider_created_idx
+#   Exam            ("exam_date", "semester")               -> exam_date_sem_idx
+#   Event           ("-start_at",)                          -> event_start_idx
+#   News            ("-published_at", "-id")                -> news_published_idx
+#   StaffProfile    ("-is_hod", "order", "role", "name")    -> staff_order_idx
+#   GalleryMedia    ("-created_at", "-id")                  -> gallery_created_idx
+#   ContactMessage  ("-created_at",)                        -> contact_created_idx
+#   AboutImage      ("-created_at",)                        -> aboutimage_created_idx
+#   HighlightCard   ("order", "-created_at")                 -> highlight_order_idx
+#   SectionImage    ("-created_at",)                        -> section_created_idx
+# Keep the two in step when changing either.
+
+
 # =========================
 # Base Mixin Classes
 # =========================
+class DeferringChangeList(ChangeList):
+    """ChangeList that leaves the admin's `preferred_list_defer` columns out of the row query."""
+
+    def get_queryset(self, request, *args, **kwargs):
+        qs = super().get_queryset(request, *args, **kwargs)
+        defer = self.model_admin._existing(self.model_admin.preferred_list_defer)
+        return qs.defer(*defer) if defer else qs
+
+
 class SafeFieldAdminMixin:
     """Auto-detect list_display, search_fields, list_filter. Adds previews for images/files.
 
@@ -39,21 +114,97 @@ class SafeFieldAdminMixin:
     - If `preferred_list_display` is set (non-empty), use that (and include preview thumb if configured).
     - Otherwise if the ModelAdmin subclass has an explicit `list_display` attribute, use that.
     - Otherwise fall back to default super().get_list_display(request).
+
+    `list_select_related` is filled in when the admin class is created: from
+    `preferred_list_select_related` if set, otherwise every forward FK / one-to-one on the
+    model. Django applies it to the changelist query only, not the change form.
+    Many-to-many relations listed in `preferred_prefetch_related` are fetched in one extra
+    query each. Keep reverse FK (1:N) sets out of it: prefetching those loads every child
+    row of every listed object into memory, which costs more than it saves.
+    Large text columns named in `preferred_list_defer` are not loaded for the changelist;
+    the change form still reads full rows.
+
+    Changelists show 25 rows per page (Django's default is 100) and "Show all" is capped at
+    200, so each page renders and fetches a quarter of the rows. Small, frequently edited
+    lists can raise `list_per_page` again.
+    With `paginator = CachedCountPaginator` the changelist COUNT(*) is cached for a minute
+    per filter set, so a new row can take that long to show up in the total.
     """
 
     preferred_list_display = ()
     preferred_search_fields = ()
     preferred_list_filter = ()
+    preferred_list_select_related = ()
+    preferred_prefetch_related = ()
+    preferred_list_defer = ()
     preferred_date_hierarchy = None
     thumb_field = None  # e.g. "image" field name
+    pdf_field = None    # e.g. "pdf_file"; rendered by `_pdf_preview`
+    preview_height = 60
+    show_full_result_count = False  # skip the second, unfiltered COUNT(*) on filtered lists
+    list_per_page = 25
+    list_max_show_all = 200
+
+    # attrgetters for the preview fields, built per admin class in __init_subclass__
+    _thumb_getter = _pdf_getter = None
 
     def _existing(self, fields):
-        return [f for f in fields if model_has_field(self.model, f)]
+        # memoized per admin instance, keyed by the tuple of requested names
+        key = tuple(fields)
+        cache = self.__dict__.setdefault("_existing_cache", {})
+        if key not in cache:
+            cache[key] = tuple(f for f in key if model_has_field(self.model, f))
+        return cache[key]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        model = getattr(cls, "model", None)
+        # an explicit list_select_related on the admin wins
+        if model is not None and "list_select_related" not in cls.__dict__:
+            related = cls._detect_fk_fields(model)
+            if related:
+                cls.list_select_related = related
+        cls._thumb_getter = operator.attrgetter(cls.thumb_field) if cls.thumb_field else None
+        cls._pdf_getter = operator.attrgetter(cls.pdf_field) if cls.pdf_field else None
+
+    @classmethod
+    def _detect_fk_fields(cls, model):
+        """Names of forward FK / one-to-one fields that select_related can follow."""
+        if cls.preferred_list_select_related:
+            return tuple(
+                f for f in cls.preferred_list_select_related
+                if model_has_field(model, f) and model._meta.get_field(f).is_relation
+            )
+        return tuple(
+            f.name for f in model._meta.get_fields()
+            if f.concrete and (f.many_to_one or f.one_to_one)
+        )
+
+    def get_changelist(self, request, **kwargs):
+        return DeferringChangeList
+
+    def get_paginator(self, request, queryset, per_page, orphans=0, allow_empty_first_page=True):
+        if not issubclass(self.paginator, CachedCountPaginator):
+            return super().get_paginator(request, queryset, per_page, orphans, allow_empty_first_page)
+        return self.paginator(
+            queryset, per_page, orphans, allow_empty_first_page,
+            count_cache_key=count_cache_key(request, queryset, PAGE_VAR),
+        )
+
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        if self.preferred_prefetch_related:
+            qs = qs.prefetch_related(*self.preferred_prefetch_related)
+        return qs
 
     def get_list_display(self, request):
         # 1) If preferred_list_display is non-empty, use it (plus thumb if available)
         if getattr(self, "preferred_list_display", None):
-            base = list(self._existing(self.preferred_list_display))
+            # keep model fields and admin-provided columns such as `_pdf_preview`
+            base = [
+                f for f in self.preferred_list_display
+                if f in self._existing(self.preferred_list_display) or hasattr(self, f)
+            ]
             if self.thumb_field and model_has_field(self.model, self.thumb_field):
                 return ("_thumb",) + tuple(base)
             return tuple(base)
@@ -65,34 +216,44 @@ class SafeFieldAdminMixin:
         # 3) Fallback to default implementation
         return super().get_list_display(request)
 
-    def _file_link(self, obj, fname):
-        f = getattr(obj, fname, None)
-        if not f:
-            return "-"
+    @staticmethod
+    def _read(getter, obj):
+        if getter is None:
+            return None
         try:
-            return format_html('<a href="{}" target="_blank">Open</a>', f.url)
-        except Exception:
-            return "-"
+            return getter(obj)
+        except AttributeError:
+            return None
 
-    def _image_tag(self, obj, fname, height=48):
-        f = getattr(obj, fname, None)
+    def _file_link(self, f):
         if not f:
             return "-"
-        try:
-            return format_html(
-                '<img src="{}" style="height:{}px;border-radius:6px;object-fit:cover;">',
-                f.url, height
-            )
-        except Exception:
+        return format_html(_FILE_LINK_TPL, f.url)
+
+    def _image_tag(self, f, height=48):
+        if not f:
             return "-"
+        return format_html(_IMG_TPL, f.url, height)
 
     def _thumb(self, obj):
-        if not self.thumb_field:
-            return "-"
-        return self._image_tag(obj, self.thumb_field)
+        return self._image_tag(self._read(self._thumb_getter, obj))
 
     _thumb.short_description = "Preview"
 
+    def _preview(self, obj):
+        """Larger image preview than `_thumb`."""
+        image = self._read(self._thumb_getter, obj)
+        if image:
+            return format_html(_PREVIEW_IMG_TPL, image.url, self.preview_height)
+        return "-"
+
+    _preview.short_description = "Preview"
+
+    def _pdf_preview(self, obj):
+        return self._file_link(self._read(self._pdf_getter, obj))
+
+    _pdf_preview.short_description = "PDF"
+
     def get_search_fields(self, request):
         # prefer explicit preferred_search_fields, then explicit search_fields attribute, then default
         if getattr(self, "preferred_search_fields", None):
@@ -114,64 +275,118 @@ class SafeFieldAdminMixin:
 
 
 class TimestampedReadOnlyMixin:
-    """Automatically set created_at / updated_at as read-only if present."""
-    def get_readonly_fields(self, request, obj=None):
-        ro = list(getattr(super(), "get_readonly_fields", lambda *a, **k: [])(request, obj))
-        for f in ("created_at", "updated_at"):
-            if model_has_field(self.model, f) and f not in ro:
-                ro.append(f)
-        return tuple(ro)
+    """Automatically set created_at / updated_at (plus any `extra_readonly_fields`) as read-only if present."""
+    extra_readonly_fields = ()
+    _readonly_cache = None  # resolved once per admin class
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        model = getattr(cls, "model", None)
+        cls._readonly_cache = cls._timestamp_fields(model) if model is not None else None
+
+    @classmethod
+    def _timestamp_fields(cls, model):
+        return tuple(
+            f for f in ("created_at", "updated_at") + tuple(cls.extra_readonly_fields)
+            if model_has_field(model, f)
+        )
 
+    def get_readonly_fields(self, request, obj=None):
+        ro = tuple(getattr(super(), "get_readonly_fields", lambda *a, **k: ())(request, obj))
+        extra = self._readonly_cache
+        if extra is None:
+            extra = self._timestamp_fields(self.model)
+        return ro + tuple(f for f in extra if f not in ro)
 
-Timetable = get_model("ClassTimetable")
-if Timetable:
-    @admin.register(Timetable)
-    class ClassTimetableAdmin(SafeFieldAdminMixin, TimestampedReadOnlyMixin, admin.ModelAdmin):
-        model = Timetable
-        preferred_list_display = ("course", "semester", "academic_year", "pdf_preview", "created_at")
-        preferred_search_fields = ("course", "academic_year")
-        preferred_list_filter = ("course", "semester", "academic_year")
-        preferred_date_hierarchy = "created_at"
-        ordering = ("-created_at", "course", "semester")
 
-        def pdf_preview(self, obj):
-            return self._file_link(obj, "pdf_file")
-        pdf_preview.short_description = "PDF"
+def _flag_action(name, field, value, description):
+    """Admin action that sets a boolean `field` to `value` on the selected rows."""
+    def action(modeladmin, request, queryset):
+        _chunked_update(queryset, field, value)
+    action.__name__ = name
+    action.short_description = description
+    return action
 
 
 # =========================
 # Register Each Model
 # =========================
 
-# Slider
-Slider = get_model("Slider")
-if Slider:
-    @admin.register(Slider)
-    class SliderAdmin(SafeFieldAdminMixin, TimestampedReadOnlyMixin, admin.ModelAdmin):
-        model = Slider
-        thumb_field = "image"
-        preferred_list_display = ("title", "is_active", "created_at")
-        preferred_search_fields = ("title", "caption")
-        preferred_list_filter = ("is_active",)
-        preferred_date_hierarchy = "created_at"
-        ordering = ("-created_at",)
-
-
-# Exams
-Exam = get_model("Exam")
-if Exam:
-    @admin.register(Exam)
-    class ExamAdmin(SafeFieldAdminMixin, TimestampedReadOnlyMixin, admin.ModelAdmin):
-        model = Exam
-        preferred_list_display = ("title", "course", "semester", "exam_date", "pdf_preview")
-        preferred_search_fields = ("title", "course")
-        preferred_list_filter = ("course", "semester")
-        preferred_date_hierarchy = "exam_date"
-        ordering = ("exam_date", "semester")
-
-        def pdf_preview(self, obj):
-            return self._file_link(obj, "pdf_file")
-        pdf_preview.short_description = "PDF"
+# Declarative admins: (model name, ModelAdmin attributes). Anything with custom
+# methods or forms gets its own class body further down.
+ADMIN_CONFIG = (
+    ("ClassTimetable", {
+        "pdf_field": "pdf_file",
+        "preferred_list_display": ("course", "semester", "academic_year", "_pdf_preview", "created_at"),
+        "preferred_search_fields": ("course", "academic_year"),
+        "preferred_list_filter": ("course", "semester", "academic_year"),
+        "preferred_date_hierarchy": "created_at",
+        "ordering": ("-created_at", "course", "semester"),
+    }),
+    ("Slider", {
+        "thumb_field": "image",
+        "preferred_list_display": ("title", "is_active", "created_at"),
+        "preferred_search_fields": ("title", "caption"),
+        "preferred_list_filter": ("is_active",),
+        "preferred_date_hierarchy": "created_at",
+        "ordering": ("-created_at",),
+    }),
+    ("Exam", {
+        "pdf_field": "pdf_file",
+        "preferred_list_display": ("title", "course", "semester", "exam_date", "_pdf_preview"),
+        "preferred_search_fields": ("title", "course"),
+        "preferred_list_filter": ("course", "semester"),
+        "preferred_date_hierarchy": "exam_date",
+        "ordering": ("exam_date", "semester"),
+    }),
+    ("News", {
+        "thumb_field": "image",
+        "preferred_list_display": ("title", "category", "published_at", "is_featured"),
+        "preferred_search_fields": ("title", "summary"),
+        "preferred_list_filter": ("category", "is_featured"),
+        "preferred_list_defer": ("body",),
+        "preferred_date_hierarchy": "published_at",
+        "ordering": ("-published_at", "-id"),
+        "paginator": CachedCountPaginator,
+        "actions": (
+            _flag_action("mark_featured", "is_featured", True, "Mark selected as featured"),
+            _flag_action("unmark_featured", "is_featured", False, "Unmark selected as featured"),
+        ),
+    }),
+    ("GalleryMedia", {
+        "thumb_field": "image",
+        "preferred_list_display": ("caption", "media_type", "year", "created_at"),
+        "preferred_search_fields": ("caption",),
+        "preferred_list_filter": ("media_type", "year"),
+        "preferred_list_select_related": ("album",),
+        "ordering": ("-created_at", "-id"),
+        "paginator": CachedCountPaginator,
+    }),
+    ("ContactMessage", {
+        "preferred_list_display": ("name", "email", "subject", "is_handled", "created_at"),
+        "preferred_search_fields": ("name", "email", "subject"),
+        "preferred_list_filter": ("is_handled",),
+        "preferred_list_defer": ("message",),
+        "preferred_date_hierarchy": "created_at",
+        "ordering": ("-created_at",),
+        "paginator": CachedCountPaginator,
+        "extra_readonly_fields": ("message",),
+        "actions": (
+            _flag_action("mark_handled", "is_handled", True, "Mark selected as handled"),
+            _flag_action("mark_unhandled", "is_handled", False, "Mark selected as unhandled"),
+        ),
+    }),
+)
+
+for _name, _attrs in ADMIN_CONFIG:
+    _model = get_model(_name)
+    if not _model:
+        continue
+    admin.site.register(_model, type(
+        f"{_name}Admin",
+        (SafeFieldAdminMixin, TimestampedReadOnlyMixin, admin.ModelAdmin),
+        {"__module__": __name__, "model": _model, **_attrs},
+    ))
 
 
 # Events
@@ -184,18 +399,16 @@ if Event:
         preferred_list_display = ("title", "category", "start_at", "end_at", "venue", "is_registration_open", "video_preview")
         preferred_search_fields = ("title", "venue", "short_description")
         preferred_list_filter = ("category", "is_registration_open")
+        preferred_list_defer = ("description", "short_description")
         preferred_date_hierarchy = "start_at"
         ordering = ("-start_at",)
 
         # show a link to uploaded video or external URL
         def video_preview(self, obj):
-            if getattr(obj, "video", None):
-                try:
-                    return format_html('<a href="{}" target="_blank">🎬 Video File</a>', obj.video.url)
-                except Exception:
-                    return "-"
-            if getattr(obj, "video_url", None):
-                return format_html('<a href="{}" target="_blank">🔗 External</a>', obj.video_url)
+            if obj.video:
+                return format_html(_VIDEO_FILE_TPL, obj.video.url)
+            if obj.video_url:
+                return format_html(_VIDEO_URL_TPL, obj.video_url)
             return "-"
         video_preview.short_description = "Video"
 
@@ -211,30 +424,6 @@ if Event:
         readonly_fields = ("created_at",)
 
 
-# News
-News = get_model("News")
-if News:
-    @admin.register(News)
-    class NewsAdmin(SafeFieldAdminMixin, TimestampedReadOnlyMixin, admin.ModelAdmin):
-        model = News
-        thumb_field = "image"
-        preferred_list_display = ("title", "category", "published_at", "is_featured")
-        preferred_search_fields = ("title", "summary")
-        preferred_list_filter = ("category", "is_featured")
-        preferred_date_hierarchy = "published_at"
-        ordering = ("-published_at", "-id")
-
-        actions = ("mark_featured", "unmark_featured")
-
-        def mark_featured(self, request, queryset):
-            queryset.update(is_featured=True)
-        mark_featured.short_description = "Mark selected as featured"
-
-        def unmark_featured(self, request, queryset):
-            queryset.update(is_featured=False)
-        unmark_featured.short_description = "Unmark selected as featured"
-
-
 # Staff
 StaffProfile = get_model("StaffProfile")
 if StaffProfile:
@@ -250,6 +439,7 @@ if StaffProfile:
         search_fields = ("name", "email", "phone", "role")
         list_filter = ("role", "is_hod")
         ordering = ("-is_hod", "order", "role", "name")
+        list_per_page = 50  # small table, ordered by hand via list_editable
 
         # fieldsets including 'order' so it shows in the change/add form
         fieldsets = (
@@ -263,72 +453,21 @@ if StaffProfile:
 
         # Optional admin action to set selected staff as HOD (first selected)
         def make_hod(modeladmin, request, queryset):
-            first = queryset.first()
-            if not first:
-                return
-            # clear existing HOD flags
-            StaffProfile.objects.exclude(pk=first.pk).filter(is_hod=True).update(is_hod=False)
-            first.is_hod = True
-            first.save()
-            modeladmin.message_user(request, f"{first.name} is now set as HOD.")
+            with transaction.atomic():
+                first = queryset.values_list("pk", "name").first()
+                if first is None:
+                    return
+                pk, name = first
+                # clear existing HODs the same way the pre_save signal does, then flag the new one
+                StaffProfile.objects.filter(
+                    (Q(is_hod=True) | Q(role=StaffRole.HOD)) & ~Q(pk=pk)
+                ).update(is_hod=False, role=StaffRole.PROFESSOR)
+                StaffProfile.objects.filter(pk=pk).update(is_hod=True)
+            modeladmin.message_user(request, f"{name} is now set as HOD.")
         make_hod.short_description = "Set first selected staff as HOD"
         actions = (make_hod,)
 
 
-# GalleryMedia
-GalleryMedia = get_model("GalleryMedia")
-if GalleryMedia:
-    @admin.register(GalleryMedia)
-    class GalleryMediaAdmin(SafeFieldAdminMixin, TimestampedReadOnlyMixin, admin.ModelAdmin):
-        model = GalleryMedia
-        thumb_field = "image"
-        preferred_list_display = ("caption", "media_type", "year", "created_at")
-        preferred_search_fields = ("caption",)
-        preferred_list_filter = ("media_type", "year")
-        ordering = ("-created_at", "-id")
-
-        def preview(self, obj):
-            """Show image thumbnail or video link in admin."""
-            if getattr(obj, "media_type", None) == "photo" and getattr(obj, "image", None):
-                return format_html(
-                    '<img src="{}" style="height:60px;border-radius:8px;border:0;object-fit:cover;">',
-                    obj.image.url,
-                )
-            elif getattr(obj, "media_type", None) == "video" and getattr(obj, "video", None):
-                return format_html('<a href="{}" target="_blank">🎥 View Video</a>', obj.video.url)
-            return "-"
-        preview.short_description = "Preview"
-
-
-# Contact Messages
-ContactMessage = get_model("ContactMessage")
-if ContactMessage:
-    @admin.register(ContactMessage)
-    class ContactMessageAdmin(SafeFieldAdminMixin, TimestampedReadOnlyMixin, admin.ModelAdmin):
-        model = ContactMessage
-        preferred_list_display = ("name", "email", "subject", "is_handled", "created_at")
-        preferred_search_fields = ("name", "email", "subject")
-        preferred_list_filter = ("is_handled",)
-        preferred_date_hierarchy = "created_at"
-        ordering = ("-created_at",)
-
-        actions = ("mark_handled", "mark_unhandled")
-
-        def mark_handled(self, request, queryset):
-            queryset.update(is_handled=True)
-        mark_handled.short_description = "Mark selected as handled"
-
-        def mark_unhandled(self, request, queryset):
-            queryset.update(is_handled=False)
-        mark_unhandled.short_description = "Mark selected as unhandled"
-
-        def get_readonly_fields(self, request, obj=None):
-            ro = list(super().get_readonly_fields(request, obj))
-            if "message" in [f.name for f in self.model._meta.fields]:
-                ro.append("message")
-            return tuple(ro)
-
-
 # Department Settings
 DepartmentSettings = get_model("DepartmentSettings")
 if DepartmentSettings:
@@ -338,19 +477,20 @@ if DepartmentSettings:
 
         def has_add_permission(self, request):
             """Only one DepartmentSettings instance allowed."""
-            if self.model.objects.exists():
+            if _singleton_exists(self.model, cache_keys.DEPARTMENT_SETTINGS_EXISTS):
                 return False
             return super().has_add_permission(request)
 
         def get_fields(self, request, obj=None):
             """Exclude id from form fields."""
-            return [f.name for f in self.model._meta.fields if f.name != "id"]
+            return list(model_field_names(self.model))
 
 
 # AboutImage
 @admin.register(AboutImage)
-class AboutImageAdmin(admin.ModelAdmin):
-    list_display = ("id", "title", "alt_text", "created_at", "preview")
+class AboutImageAdmin(SafeFieldAdminMixin, admin.ModelAdmin):
+    thumb_field = "image"
+    list_display = ("id", "title", "alt_text", "created_at", "_preview")
     search_fields = ("title", "alt_text")
     ordering = ("-created_at",)
     readonly_fields = ("created_at",)
@@ -360,15 +500,9 @@ class AboutImageAdmin(admin.ModelAdmin):
         ("Timestamps", {"classes": ("collapse",), "fields": ("created_at",)}),
     )
 
-    def preview(self, obj):
-        if obj.image:
-            return format_html('<img src="{}" style="height:60px;border-radius:8px;">', obj.image.url)
-        return "-"
-    preview.short_description = "Preview"
-
     def has_add_permission(self, request):
         """Allow only 1 AboutImage entry."""
-        if AboutImage.objects.exists():
+        if _singleton_exists(AboutImage, cache_keys.ABOUT_IMAGE_EXISTS):
             return False
         return super().has_add_permission(request)
 
@@ -401,10 +535,11 @@ if HighlightCard:
             image = cleaned.get("image")
             # only validate active-count when saving an active card with an image
             if is_active and image:
-                # count existing active highlight cards with images (exclude current pk if editing)
-                qs = HighlightCard.objects.filter(is_active=True).exclude(pk=self.instance.pk)
-                qs = qs.exclude(image__isnull=True).exclude(image__exact="")
-                active_count = qs.count()
+                # other active cards with an image (exclude current pk if editing);
+                # image > '' rules out both NULL and empty in one predicate
+                qs = HighlightCard.objects.filter(Q(is_active=True, image__gt="") & ~Q(pk=self.instance.pk))
+                # only whether the limit is reached matters, so stop counting there
+                active_count = qs[: self.MAX_ACTIVE].count()
                 if active_count >= self.MAX_ACTIVE:
                     raise forms.ValidationError(
                         f"Cannot mark active: there are already {active_count} active highlight cards. "
@@ -432,12 +567,6 @@ if HighlightCard:
             ("Timestamps", {"classes": ("collapse",), "fields": ("created_at",)}),
         )
 
-        def get_readonly_fields(self, request, obj=None):
-            ro = list(super().get_readonly_fields(request, obj))
-            if model_has_field(self.model, "created_at") and "created_at" not in ro:
-                ro.append("created_at")
-            return tuple(ro)
-
 
 # -------------------------
 # SectionImage (optional single-use section images, e.g., 'about' / 'bottom')
@@ -445,9 +574,10 @@ if HighlightCard:
 SectionImage = get_model("SectionImage")
 if SectionImage:
     @admin.register(SectionImage)
-    class SectionImageAdmin(admin.ModelAdmin):
+    class SectionImageAdmin(SafeFieldAdminMixin, admin.ModelAdmin):
         model = SectionImage
-        list_display = ("key", "title", "created_at", "preview")
+        thumb_field = "image"
+        list_display = ("key", "title", "created_at", "_preview")
         list_display_links = ("title",)
         search_fields = ("key", "title")
         ordering = ("-created_at",)
@@ -457,20 +587,6 @@ if SectionImage:
             ("Timestamps", {"classes": ("collapse",), "fields": ("created_at",)}),
         )
 
-        def preview(self, obj):
-            if getattr(obj, "image", None):
-                return format_html('<img src="{}" style="height:60px;border-radius:8px;">', obj.image.url)
-            return "-"
-        preview.short_description = "Preview"
-
         def has_add_permission(self, request):
             """Optionally allow multiple keys but prevent duplicate key entries (if 'key' is present)."""
             return super().has_add_permission(request)
-
-
-# =========================
-# Admin Site Branding
-# =========================
-admin.site.site_header = "CS Department Administration"
-admin.site.site_title = "CS Dept Admin"
-admin.site.index_title = "Manage Website Content"
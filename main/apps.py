@@ -8,6 +8,14 @@ class MainConfig(AppConfig):
     verbose_name = "CS Department"
 
     def ready(self):
-        # Place for signals import if you add a signals.py later
-        # from . import signals  # noqa: F401
-        pass
+        from django.contrib import admin
+
+        # cache invalidation receivers
+        from . import signals  # noqa: F401
+        # SQLite PRAGMAs for each new connection
+        from . import db  # noqa: F401
+
+        # Admin site branding
+        admin.site.site_header = "CS Department Administration"
+        admin.site.site_title = "CS Dept Admin"
+        admin.site.index_title = "Manage Website Content"
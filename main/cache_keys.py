@@ -0,0 +1,20 @@
+# main/cache_keys.py
+"""
+Cache keys shared between the code that fills a cache entry and the
+receivers in main.signals that clear it when the underlying rows change.
+"""
+
+DEPARTMENT_SETTINGS = "department_settings"
+# context_processors._common_context() result
+COMMON_CONTEXT = "common_context"
+# views._build_home_context() result (time-based blocks, so short timeout)
+HOME_CONTEXT = "home_context"
+# filter dropdowns (distinct years)
+GALLERY_YEARS = "gallery_years"
+TIMETABLE_YEARS = "timetable_years"
+# {key: latest SectionImage or None}, filled by SectionImage.latest_for
+SECTION_IMAGES = "section_images"
+
+# admin singleton guards (has_add_permission)
+ABOUT_IMAGE_EXISTS = "about_image_exists"
+DEPARTMENT_SETTINGS_EXISTS = "department_settings_exists"
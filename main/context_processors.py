@@ -1,8 +1,82 @@
-from .models import DepartmentSettings
+from django.core.cache import cache
 
-def department_settings(request):
+from . import cache_keys
+from .models import AboutImage, DepartmentSettings, HighlightCard, SectionImage
+
+
+def common_context(request):
+    """
+    Adds the shared page context (department settings, about/bottom images,
+    highlight cards) to every template rendered with a request.
     """
-    Adds DepartmentSettings (singleton) to all templates.
+    return _common_context()
+
+
+def _repeat_for_scroll(items: list, min_items: int = 8) -> list:
+    """Repeat the list until its length >= min_items (returned as-is if already long enough)."""
+    n = len(items)
+    if n == 0:
+        return []
+    if n >= min_items:
+        return items
+    return items * -(-min_items // n)  # ceil division
+
+
+def _common_context() -> dict:
+    """Shared page context, cached until one of its source models changes (see main.signals)."""
+    return dict(cache.get_or_set(cache_keys.COMMON_CONTEXT, _build_common_context, timeout=300))
+
+
+def _build_common_context() -> dict:
     """
-    settings = DepartmentSettings.objects.first()
-    return {"department_settings": settings}
+    Return department settings, about image, bottom image and highlight cards for all templates.
+
+    - about_image: prefers SectionImage with key='about', else latest SectionImage,
+      else AboutImage fallback.
+    - bottom_image: prefers SectionImage with key='bottom', else next most recent SectionImage.
+    - highlight_cards: only active cards that have an image.
+    """
+    ctx = {"department_settings": DepartmentSettings.current()}
+
+    try:
+        # The newest few rows answer both keys and both fallbacks in one query; a key is
+        # looked up on its own only if the window is full and doesn't contain it.
+        window = 4
+        rows = list(
+            SectionImage.objects.only("key", "image", "alt_text", "title").order_by("-created_at")[:window]
+        )
+        keyed = {}
+        for row in rows:
+            keyed.setdefault(row.key, row)
+        about_section = keyed.get("about")
+        bottom_section = keyed.get("bottom")
+
+        # 1. Try by explicit keys
+        if about_section is None and len(rows) == window:
+            about_section = SectionImage.latest_for("about")
+        if bottom_section is None and len(rows) == window:
+            bottom_section = SectionImage.latest_for("bottom")
+
+        # 2. Fallbacks: latest SectionImages
+        if not about_section and rows:
+            about_section = rows[0]
+        if not bottom_section:
+            bottom_section = next((r for r in rows if r.pk != getattr(about_section, "pk", None)), None)
+    except Exception:
+        about_section = None
+        bottom_section = None
+
+    # AboutImage is only the last resort, so only query it when no section image exists
+    ctx["about_image"] = about_section or AboutImage.objects.order_by("-created_at").first()
+    ctx["bottom_image"] = bottom_section
+
+    try:
+        cards_qs = list(
+            HighlightCard.objects.filter(is_active=True, image__gt="")
+            .order_by("order", "-created_at")
+        )
+    except Exception:
+        cards_qs = []
+
+    ctx["highlight_cards"] = _repeat_for_scroll(cards_qs, min_items=8)
+    return ctx
@@ -0,0 +1,24 @@
+# main/db.py
+"""Per-connection database tuning, connected from MainConfig.ready()."""
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+
+# WAL lets readers run alongside a writer (gunicorn workers share one file);
+# NORMAL sync is durable under WAL except for the last commits on power loss.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=134217728",
+)
+
+
+@receiver(connection_created)
+def _tune_sqlite(sender, connection, **kwargs):
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
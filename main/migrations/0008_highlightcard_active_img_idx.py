@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2026-10-15 17:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0007_alter_album_year_alter_gallerymedia_year'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='highlightcard',
+            index=models.Index(condition=models.Q(('image__gt', ''), ('is_active', True)), fields=['order', '-created_at'], name='highlight_active_img_idx'),
+        ),
+    ]
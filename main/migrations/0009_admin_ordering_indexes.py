@@ -0,0 +1,57 @@
+# Generated by Django 5.2.6 on 2026-10-15 17:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0008_highlightcard_active_img_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='aboutimage',
+            index=models.Index(fields=['-created_at'], name='aboutimage_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='classtimetable',
+            index=models.Index(fields=['-created_at', 'course', 'semester'], name='timetable_cl_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(fields=['-created_at'], name='contact_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['-start_at'], name='event_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='exam',
+            index=models.Index(fields=['exam_date', 'semester'], name='exam_date_sem_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='gallerymedia',
+            index=models.Index(fields=['-created_at', '-id'], name='gallery_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='highlightcard',
+            index=models.Index(fields=['order', '-created_at'], name='highlight_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='news',
+            index=models.Index(fields=['-published_at', '-id'], name='news_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sectionimage',
+            index=models.Index(fields=['-created_at'], name='section_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='slider',
+            index=models.Index(fields=['-created_at'], name='slider_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='staffprofile',
+            index=models.Index(fields=['-is_hod', 'order', 'role', 'name'], name='staff_order_idx'),
+        ),
+    ]
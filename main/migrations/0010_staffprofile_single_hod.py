@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2026-10-15 17:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0009_admin_ordering_indexes'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='staffprofile',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_hod', True)), fields=('is_hod',), name='single_hod'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.6 on 2026-10-15 17:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0010_staffprofile_single_hod'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='album',
+            index=models.Index(fields=['-created_at'], name='album_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='news',
+            index=models.Index(fields=['category', '-published_at'], name='news_cat_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sectionimage',
+            index=models.Index(fields=['key', '-created_at'], name='section_key_ts_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-15 17:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0011_listing_key_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='news',
+            index=models.Index(condition=models.Q(('is_featured', True)), fields=['-published_at', '-id'], name='news_featured_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='slider',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-created_at'], name='slider_active_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-15 18:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0012_active_featured_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='slider',
+            name='image_url',
+            field=models.URLField(blank=True, help_text='Externally hosted image (CDN); used instead of the uploaded image.'),
+        ),
+    ]
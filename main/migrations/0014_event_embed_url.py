@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-15 18:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0013_slider_image_url'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='embed_url',
+            field=models.CharField(blank=True, editable=False, max_length=300),
+        ),
+    ]
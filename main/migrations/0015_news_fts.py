@@ -0,0 +1,55 @@
+# Trigram FTS5 index over News text columns, used by main.search on SQLite.
+
+from django.db import migrations
+
+FTS_SQL = [
+    """CREATE VIRTUAL TABLE main_news_fts USING fts5(
+        title, summary, body, content='main_news', content_rowid='id', tokenize='trigram'
+    )""",
+    "INSERT INTO main_news_fts(main_news_fts) VALUES ('rebuild')",
+    """CREATE TRIGGER main_news_fts_ai AFTER INSERT ON main_news BEGIN
+        INSERT INTO main_news_fts(rowid, title, summary, body) VALUES (new.id, new.title, new.summary, new.body);
+    END""",
+    """CREATE TRIGGER main_news_fts_ad AFTER DELETE ON main_news BEGIN
+        INSERT INTO main_news_fts(main_news_fts, rowid, title, summary, body)
+        VALUES ('delete', old.id, old.title, old.summary, old.body);
+    END""",
+    """CREATE TRIGGER main_news_fts_au AFTER UPDATE OF title, summary, body ON main_news BEGIN
+        INSERT INTO main_news_fts(main_news_fts, rowid, title, summary, body)
+        VALUES ('delete', old.id, old.title, old.summary, old.body);
+        INSERT INTO main_news_fts(rowid, title, summary, body) VALUES (new.id, new.title, new.summary, new.body);
+    END""",
+]
+
+DROP_SQL = [
+    "DROP TRIGGER IF EXISTS main_news_fts_au",
+    "DROP TRIGGER IF EXISTS main_news_fts_ad",
+    "DROP TRIGGER IF EXISTS main_news_fts_ai",
+    "DROP TABLE IF EXISTS main_news_fts",
+]
+
+
+def _run(statements):
+    def run(apps, schema_editor):
+        # SQLite only; builds without FTS5/trigram (SQLite < 3.34) keep using icontains
+        if schema_editor.connection.vendor != "sqlite":
+            return
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5'), sqlite_version()")
+            fts5, version = cursor.fetchone()
+            if not fts5 or tuple(map(int, version.split("."))) < (3, 34):
+                return
+            for sql in statements:
+                cursor.execute(sql)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0014_event_embed_url'),
+    ]
+
+    operations = [
+        migrations.RunPython(_run(FTS_SQL), _run(DROP_SQL)),
+    ]
@@ -1,23 +1,85 @@
 from __future__ import annotations
 
-import os
-import uuid
+import functools
+import operator
+import re
+import secrets
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
-from django.db import models
-from django.db.models.signals import pre_save
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.template.defaultfilters import slugify
 from django.urls import reverse
 from django.utils import timezone
 
+from . import cache_keys
+
 # ---------- Small helpers ----------
-def year_choices(start: int = 2000) -> list[tuple[int, int]]:
-    this = timezone.now().year
-    return [(y, y) for y in range(this, start - 1, -1)]
+# Video providers recognised by Event.get_embed_url
+_YOUTUBE_RE = re.compile(r'(?:v=|youtu\.be/)([A-Za-z0-9_\-]{6,})')
+_VIMEO_RE = re.compile(r'vimeo\.com/(?:video/)?(\d+)')
+
+
+def _embed_url(video_url: str) -> str:
+    url = video_url.strip()
+    # YouTube: handle youtube.com/watch?v=ID and youtu.be/ID
+    m = _YOUTUBE_RE.search(url)
+    if m:
+        return f'https://www.youtube.com/embed/{m.group(1)}'
+    # Vimeo: handle vimeo.com/ID and player.vimeo.com/video/ID
+    m = _VIMEO_RE.search(url)
+    if m:
+        return f'https://player.vimeo.com/video/{m.group(1)}'
+    # Fallback - return the provided URL (some services may allow iframe src directly)
+    return url
+
+
+def year_choices(start: int = 2000) -> tuple[tuple[int, int], ...]:
+    return _year_choices(timezone.now().year, start)
+
+
+@functools.lru_cache(maxsize=1)
+def _year_choices(this: int, start: int) -> tuple[tuple[int, int], ...]:
+    # keyed on the current year, so it only rebuilds when the year rolls over
+    return tuple((y, y) for y in range(this, start - 1, -1))
 
 
 def _unique_name(prefix: str, filename: str) -> str:
-    base, ext = os.path.splitext(filename)
-    return f"{prefix}/{uuid.uuid4().hex}{ext.lower()}"
+    dot = filename.rfind(".")
+    ext = filename[dot:].lower() if dot > 0 else ""
+    h = secrets.token_hex(16)
+    # two levels of 2-char shards keep any one upload directory small
+    return f"{prefix}/{h[:2]}/{h[2:4]}/{h}{ext}"
+
+
+def _unlink_on_commit(*files) -> None:
+    """Delete stored files once the current transaction commits (right away in autocommit).
+
+    Called after the row is deleted, so storage round-trips stay off the DELETE and a
+    rolled-back transaction never loses a file its row still points to.
+    """
+    _delete_on_commit([(f.storage, f.name) for f in files if f])
+
+
+def _delete_on_commit(pending: list) -> None:
+    # pending: (storage, name) pairs
+    if pending:
+        transaction.on_commit(lambda: _delete_stored(pending))
+
+
+def _delete_stored(pending: list) -> None:
+    by_storage = {}
+    for storage, name in pending:
+        by_storage.setdefault(storage, []).append(name)
+    for storage, names in by_storage.items():
+        bucket = getattr(storage, "bucket", None)  # django-storages S3 backends
+        if bucket is None:
+            for name in names:
+                storage.delete(name)
+            continue
+        keys = [{"Key": storage._normalize_name(name)} for name in names]
+        for i in range(0, len(keys), 1000):  # DeleteObjects takes at most 1000 keys
+            bucket.delete_objects(Delete={"Objects": keys[i:i + 1000], "Quiet": True})
 
 
 # ---------- upload_to functions ----------
@@ -59,16 +121,24 @@ class DepartmentSettings(models.Model):
     def __str__(self):
         return self.site_name if self.site_name else "Department Settings"
 
-    def delete(self, *args, **kwargs):
-        if self.logo:
-            self.logo.delete(save=False)
-        super().delete(*args, **kwargs)
+    @classmethod
+    def current(cls):
+        """The settings row (or None), cached until it is saved or deleted."""
+        return cache.get_or_set(
+            cache_keys.DEPARTMENT_SETTINGS,
+            lambda: cls.objects.only(
+                "site_name", "logo", "about_short", "address", "email", "phone",
+                "instagram", "facebook", "linkedin", "x_twitter",
+            ).first(),
+            timeout=3600,
+        )
 
 
 # ---------- Slider ----------
 class Slider(models.Model):
     title = models.CharField(max_length=200, blank=True, null=True)
     image = models.ImageField(upload_to=slider_upload, blank=True, null=True)
+    image_url = models.URLField(blank=True, help_text="Externally hosted image (CDN); used instead of the uploaded image.")
     video = models.FileField(upload_to=slider_video_upload, blank=True, null=True)
     caption = models.TextField(blank=True, null=True)
     is_active = models.BooleanField(default=True)
@@ -78,21 +148,25 @@ class Slider(models.Model):
         ordering = ["-created_at"]
         verbose_name = "🎞️ Slider"
         verbose_name_plural = "🎞️ Sliders"
+        indexes = [
+            models.Index(fields=["-created_at"], name="slider_created_idx"),
+            models.Index(fields=["-created_at"], condition=models.Q(is_active=True), name="slider_active_idx"),
+        ]
 
     def __str__(self):
         return self.title or f"Slider {self.id}"
 
+    @property
+    def image_src(self) -> str:
+        """URL to render: the external image_url when set, else the uploaded image."""
+        if self.image_url:
+            return self.image_url
+        return self.image.url if self.image else ""
+
     def clean(self):
-        if not self.image and not self.video:
+        if not (self.image or self.image_url or self.video):
             raise ValidationError("Please provide either an image or a video for the slider.")
 
-    def delete(self, *args, **kwargs):
-        if self.image:
-            self.image.delete(save=False)
-        if self.video:
-            self.video.delete(save=False)
-        super().delete(*args, **kwargs)
-
 
 # ---------- About Section Image ----------
 class AboutImage(models.Model):
@@ -104,20 +178,24 @@ class AboutImage(models.Model):
     class Meta:
         verbose_name = "🖼 About Image"
         verbose_name_plural = "🖼 About Images"
+        indexes = [models.Index(fields=["-created_at"], name="aboutimage_created_idx")]
 
     def save(self, *args, **kwargs):
-        if not self.pk and AboutImage.objects.exists():
-            AboutImage.objects.all().delete()
-        super().save(*args, **kwargs)
+        if self.pk:
+            return super().save(*args, **kwargs)
+        # Replace the previous image: one DELETE for the old rows and the INSERT commit
+        # together, and their files are unlinked only after that commit.
+        previous = AboutImage.objects.all()
+        with transaction.atomic(using=previous.db):
+            storage = self._meta.get_field("image").storage
+            names = previous.values_list("image", flat=True)
+            _delete_on_commit([(storage, name) for name in names if name])
+            previous._raw_delete(previous.db)
+            super().save(*args, **kwargs)
 
     def __str__(self):
         return self.title or f"About Image {self.id}"
 
-    def delete(self, *args, **kwargs):
-        if self.image:
-            self.image.delete(save=False)
-        super().delete(*args, **kwargs)
-
 
 # ---------- Highlight Card (for moving row) ----------
 class HighlightCard(models.Model):
@@ -133,21 +211,26 @@ class HighlightCard(models.Model):
         ordering = ("order", "-created_at")
         verbose_name = "✨ Highlight Card"
         verbose_name_plural = "✨ Highlight Cards"
+        indexes = [
+            models.Index(fields=["order", "-created_at"], name="highlight_order_idx"),
+            # covers only active cards with an image (what the form limit and home page count),
+            # in display order so the home page reads it without a sort
+            models.Index(
+                fields=["order", "-created_at"],
+                condition=models.Q(is_active=True, image__gt=""),
+                name="highlight_active_img_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.title or f"Highlight {self.pk}"
 
-    def delete(self, *args, **kwargs):
-        if self.image:
-            self.image.delete(save=False)
-        super().delete(*args, **kwargs)
-
 
 # ---------- SectionImage (single-key images like bottom/about) ----------
 class SectionImage(models.Model):
     """
     Optional keyed section images. Use keys like 'bottom', 'about' etc.
-    Views can pick the latest entry for a key: SectionImage.objects.filter(key='bottom').first()
+    Views pick the latest entry for a key with SectionImage.latest_for('bottom').
     """
     key = models.CharField(max_length=50, help_text="Unique key for section (e.g. 'bottom', 'about')")
     title = models.CharField(max_length=150, blank=True)
@@ -159,14 +242,26 @@ class SectionImage(models.Model):
         ordering = ("-created_at",)
         verbose_name = "🖼 Section Image"
         verbose_name_plural = "🖼 Section Images"
+        indexes = [
+            models.Index(fields=["-created_at"], name="section_created_idx"),
+            # latest-per-key lookups: filter(key=...).order_by("-created_at")
+            models.Index(fields=["key", "-created_at"], name="section_key_ts_idx"),
+        ]
 
     def __str__(self):
         return f"{self.key} — {self.title or self.pk}"
 
-    def delete(self, *args, **kwargs):
-        if self.image:
-            self.image.delete(save=False)
-        super().delete(*args, **kwargs)
+    @classmethod
+    def latest_for(cls, key: str):
+        """Newest image for ``key`` (or None), cached until a SectionImage changes."""
+        cached = cache.get(cache_keys.SECTION_IMAGES) or {}
+        if key not in cached:
+            cached[key] = (
+                cls.objects.only("key", "image", "alt_text", "title")
+                .filter(key=key).order_by("-created_at").first()
+            )
+            cache.set(cache_keys.SECTION_IMAGES, cached, 3600)
+        return cached[key]
 
 
 # ---------- Exams ----------
@@ -182,6 +277,7 @@ class Exam(models.Model):
         ordering = ("exam_date", "semester")
         verbose_name = "📋 Exam"
         verbose_name_plural = "📋 Exams"
+        indexes = [models.Index(fields=["exam_date", "semester"], name="exam_date_sem_idx")]
 
     def __str__(self):
         return f"{self.title} (S{self.semester})"
@@ -190,11 +286,6 @@ class Exam(models.Model):
         if self.exam_date and self.exam_date.year < 2000:
             raise ValidationError({"exam_date": "Exam date looks invalid."})
 
-    def delete(self, *args, **kwargs):
-        if self.pdf_file:
-            self.pdf_file.delete(save=False)
-        super().delete(*args, **kwargs)
-
 
 # ---------- Class Timetable ----------
 def timetable_upload(instance, filename):
@@ -211,14 +302,11 @@ class ClassTimetable(models.Model):
         ordering = ("-created_at", "course", "semester")
         verbose_name = "📅 Class Timetable"
         verbose_name_plural = "📅 Class Timetables"
+        indexes = [models.Index(fields=["-created_at", "course", "semester"], name="timetable_cl_idx")]
 
     def __str__(self):
         return f"{self.course} S{self.semester} ({self.academic_year})"
 
-    def delete(self, *args, **kwargs):
-        if self.pdf_file:
-            self.pdf_file.delete(save=False)
-        super().delete(*args, **kwargs)
 
 # ---------- Events ----------
 class EventCategory(models.TextChoices):
@@ -230,10 +318,13 @@ class EventCategory(models.TextChoices):
     OTHER = "Other", "Other"
 
 
+# built once; TextChoices.choices rebuilds its list on every access
+EVENT_CATEGORY_CHOICES = tuple(EventCategory.choices)
+
 class Event(models.Model):
     title = models.CharField(max_length=200)
     slug = models.SlugField(max_length=220, unique=True, blank=True)
-    category = models.CharField(max_length=32, choices=EventCategory.choices, default=EventCategory.OTHER)
+    category = models.CharField(max_length=32, choices=EVENT_CATEGORY_CHOICES, default=EventCategory.OTHER)
     short_description = models.CharField(max_length=300, blank=True)
     description = models.TextField(blank=True)
     start_at = models.DateTimeField()
@@ -245,6 +336,8 @@ class Event(models.Model):
     video = models.FileField(upload_to=events_upload, blank=True, null=True, help_text="Self-hosted video file (MP4/WebM).")
     video_url = models.URLField(blank=True, null=True, help_text="External video URL (YouTube / Vimeo).")
     video_captions = models.FileField(upload_to=events_upload, blank=True, null=True, help_text="Optional VTT captions file.")
+    # derived from video_url on save (see _pre_embed_url)
+    embed_url = models.CharField(max_length=300, blank=True, editable=False)
 
     is_registration_open = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -253,6 +346,7 @@ class Event(models.Model):
         ordering = ("-start_at",)
         verbose_name = "🎉 Event"
         verbose_name_plural = "🎉 Events"
+        indexes = [models.Index(fields=["-start_at"], name="event_start_idx")]
 
     def __str__(self):
         return self.title
@@ -260,49 +354,34 @@ class Event(models.Model):
     def get_absolute_url(self):
         return reverse("event_detail", kwargs={"slug": self.slug})
 
-    @property
+    @classmethod
+    def bulk_create_with_slugs(cls, objs, **kwargs):
+        return _bulk_create_with_slugs(cls, objs, max_length=220, **kwargs)
+
+    # cached per instance: templates may read these several times per row
+    @functools.cached_property
     def is_past(self) -> bool:
         ends = self.end_at or self.start_at
         return ends < timezone.now()
 
+    @functools.cached_property
     def has_video(self) -> bool:
-        """Return True if this event has any associated video (self-hosted or external)."""
+        """True if this event has any associated video (self-hosted or external)."""
         return bool(self.video) or bool(self.video_url)
 
     def get_embed_url(self) -> str | None:
         """Return a normalized embeddable URL for known providers (YouTube, Vimeo).
 
-        Falls back to the raw video_url when a specific embed pattern isn't found.
+        Uses the embed_url stored on save; rows saved before it existed compute it here.
         """
         if not self.video_url:
             return None
-        import re
-        url = self.video_url.strip()
-        # YouTube: handle youtube.com/watch?v=ID and youtu.be/ID
-        m = re.search(r'(?:v=|youtu\.be/)([A-Za-z0-9_\-]{6,})', url)
-        if m:
-            return f'https://www.youtube.com/embed/{m.group(1)}'
-        # Vimeo: handle vimeo.com/ID and player.vimeo.com/video/ID
-        m = re.search(r'vimeo\.com/(?:video/)?(\d+)', url)
-        if m:
-            return f'https://player.vimeo.com/video/{m.group(1)}'
-        # Fallback - return the provided URL (some services may allow iframe src directly)
-        return url
+        return self.embed_url or _embed_url(self.video_url)
 
     def clean(self):
         if self.end_at and self.start_at and self.end_at < self.start_at:
             raise ValidationError({"end_at": "End time must be after start time."})
 
-    def delete(self, *args, **kwargs):
-        # remove uploaded media files when deleting the event
-        if self.image:
-            self.image.delete(save=False)
-        if self.video:
-            self.video.delete(save=False)
-        if self.video_captions:
-            self.video_captions.delete(save=False)
-        super().delete(*args, **kwargs)
-
 
 # ---------- News ----------
 class NewsCategory(models.TextChoices):
@@ -314,10 +393,12 @@ class NewsCategory(models.TextChoices):
     GENERAL = "General", "General"
 
 
+NEWS_CATEGORY_CHOICES = tuple(NewsCategory.choices)
+
 class News(models.Model):
     title = models.CharField(max_length=220)
     slug = models.SlugField(max_length=240, unique=True, blank=True)
-    category = models.CharField(max_length=20, choices=NewsCategory.choices, default=NewsCategory.GENERAL)
+    category = models.CharField(max_length=20, choices=NEWS_CATEGORY_CHOICES, default=NewsCategory.GENERAL)
     summary = models.TextField(blank=True)
     body = models.TextField(blank=True)
     image = models.ImageField(upload_to=news_upload, blank=True, null=True)
@@ -328,6 +409,14 @@ class News(models.Model):
         ordering = ("-published_at", "-id")
         verbose_name = "📰 News"
         verbose_name_plural = "📰 News"
+        indexes = [
+            models.Index(fields=["-published_at", "-id"], name="news_published_idx"),
+            # notices strip and category filter on the news page
+            models.Index(fields=["category", "-published_at"], name="news_cat_published_idx"),
+            models.Index(
+                fields=["-published_at", "-id"], condition=models.Q(is_featured=True), name="news_featured_idx"
+            ),
+        ]
 
     def __str__(self):
         return self.title
@@ -335,10 +424,9 @@ class News(models.Model):
     def get_absolute_url(self):
         return reverse("news_detail", kwargs={"slug": self.slug})
 
-    def delete(self, *args, **kwargs):
-        if self.image:
-            self.image.delete(save=False)
-        super().delete(*args, **kwargs)
+    @classmethod
+    def bulk_create_with_slugs(cls, objs, **kwargs):
+        return _bulk_create_with_slugs(cls, objs, max_length=240, **kwargs)
 
 
 # ---------- Staff ----------
@@ -352,9 +440,11 @@ class StaffRole(models.TextChoices):
     SUPPORT = "Support", "Support"
 
 
+STAFF_ROLE_CHOICES = tuple(StaffRole.choices)
+
 class StaffProfile(models.Model):
     name = models.CharField(max_length=120)
-    role = models.CharField(max_length=32, choices=StaffRole.choices, default=StaffRole.ASSISTANT)
+    role = models.CharField(max_length=32, choices=STAFF_ROLE_CHOICES, default=StaffRole.ASSISTANT)
     designation = models.CharField(max_length=120, blank=True)
     qualifications = models.CharField(max_length=200, blank=True)
     specialization = models.CharField(max_length=200, blank=True)
@@ -379,14 +469,31 @@ class StaffProfile(models.Model):
         ordering = ("-is_hod", "order", "role", "name")
         verbose_name = "👩‍🏫 Staff Profile"
         verbose_name_plural = "👨‍🏫 Staff Profiles"
+        indexes = [models.Index(fields=["-is_hod", "order", "role", "name"], name="staff_order_idx")]
+        constraints = [
+            # at most one row may carry the HoD flag
+            models.UniqueConstraint(fields=["is_hod"], condition=models.Q(is_hod=True), name="single_hod"),
+        ]
 
     def __str__(self):
         return f"{self.name} — {self.role}"
 
-    def delete(self, *args, **kwargs):
-        if self.photo:
-            self.photo.delete(save=False)
-        super().delete(*args, **kwargs)
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # HoD state as read from the DB (None if deferred), refreshed by _remember_hod
+        # after each save; _ensure_single_hod uses it to skip re-saves of the current
+        # HoD without a lookup.
+        loaded = instance.__dict__
+        if "is_hod" in loaded and "role" in loaded:
+            instance._loaded_hod = loaded["is_hod"] or loaded["role"] == StaffRole.HOD
+        return instance
+
+    def validate_constraints(self, exclude=None):
+        # Ticking is_hod on a new HoD is valid input: the pre_save signal clears the
+        # previous one before the row is written, so single_hod holds at the DB level.
+        exclude = set(exclude or ()) | {"is_hod"}
+        super().validate_constraints(exclude=exclude)
 
 
 # ---------- Album (NEW) ----------
@@ -414,6 +521,7 @@ class Album(models.Model):
         ordering = ("-created_at",)
         verbose_name = "🗂️ Album"
         verbose_name_plural = "🗂️ Albums"
+        indexes = [models.Index(fields=["-created_at"], name="album_created_idx")]
 
     def __str__(self):
         return self.title or f"Album {self.pk}"
@@ -421,18 +529,52 @@ class Album(models.Model):
     def get_absolute_url(self):
         return reverse("album_detail", kwargs={"slug": self.slug})
 
-    def delete(self, *args, **kwargs):
-        if self.cover_image:
-            self.cover_image.delete(save=False)
-        super().delete(*args, **kwargs)
+    @classmethod
+    def bulk_create_with_slugs(cls, objs, **kwargs):
+        return _bulk_create_with_slugs(cls, objs, max_length=240, **kwargs)
+
+    def delete_with_media(self) -> None:
+        """Delete the album together with its media rows and every file they reference.
+
+        Rows go in two raw DELETEs and the files are removed after commit, batched per
+        storage (one request per 1000 files on S3), instead of row-by-row cleanup.
+        Raw deletes send no post_delete, so the caches main.signals would clear for
+        GalleryMedia are cleared here after commit.
+        """
+        db = self._state.db
+        media = GalleryMedia.objects.filter(album=self)
+        storage = GalleryMedia._meta.get_field("image").storage
+        video_storage = GalleryMedia._meta.get_field("video").storage
+        pending = [(self.cover_image.storage, self.cover_image.name)] if self.cover_image else []
+        with transaction.atomic(using=db):
+            for image, video in media.values_list("image", "video"):
+                if image:
+                    pending.append((storage, image))
+                if video:
+                    pending.append((video_storage, video))
+            media._raw_delete(db)
+            Album.objects.filter(pk=self.pk)._raw_delete(db)
+            _delete_on_commit(pending)
+            transaction.on_commit(
+                lambda: cache.delete_many([cache_keys.HOME_CONTEXT, cache_keys.GALLERY_YEARS]), using=db
+            )
+        self.pk = None
 
 
 # ---------- Gallery (updated to reference album) ----------
+class GalleryMediaManager(models.Manager):
+    # gallery cards show g.album.title, so join the album up front
+    def get_queryset(self):
+        return super().get_queryset().select_related("album")
+
+
 class GalleryMedia(models.Model):
     MEDIA_TYPES = (
         ("photo", "Photo"),
         ("video", "Video"),
     )
+    # Deleting albums (single or bulk) nulls this with one UPDATE ... WHERE album_id IN (...);
+    # the collector does not load the media rows, so no custom delete path is needed.
     album = models.ForeignKey(Album, on_delete=models.SET_NULL, blank=True, null=True, related_name="media")
     media_type = models.CharField(max_length=10, choices=MEDIA_TYPES, default="photo")
     image = models.ImageField(upload_to=photos_upload, blank=True, null=True)
@@ -441,21 +583,17 @@ class GalleryMedia(models.Model):
     year = models.PositiveIntegerField(choices=year_choices(), blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = GalleryMediaManager()
+
     class Meta:
         ordering = ("-created_at", "-id")
         verbose_name = "📸 Gallery Media"
         verbose_name_plural = "📸 Gallery Media"
+        indexes = [models.Index(fields=["-created_at", "-id"], name="gallery_created_idx")]
 
     def __str__(self):
         return self.caption or f"Media #{self.id}"
 
-    def delete(self, *args, **kwargs):
-        if self.image:
-            self.image.delete(save=False)
-        if self.video:
-            self.video.delete(save=False)
-        super().delete(*args, **kwargs)
-
 
 # ---------- Contact ----------
 class ContactMessage(models.Model):
@@ -471,6 +609,7 @@ class ContactMessage(models.Model):
         ordering = ("-created_at",)
         verbose_name = "📩 Contact Message"
         verbose_name_plural = "📩 Contact Messages"
+        indexes = [models.Index(fields=["-created_at"], name="contact_created_idx")]
 
     def __str__(self):
         return f"{self.subject} — {self.name}"
@@ -479,26 +618,100 @@ class ContactMessage(models.Model):
 # ---------- Slug & HOD Utilities ----------
 def _unique_slug(instance, field_name: str, slug_field: str = "slug", max_length: int | None = None):
     base = getattr(instance, slug_field, "") or slugify(getattr(instance, field_name, "") or "")
-    base = base[: (max_length or 240)]
+    max_length = max_length or 240
+    base = base[:max_length]
     if not base:
-        base = uuid.uuid4().hex[:8]
-    slug = base
+        base = secrets.token_hex(4)
     Model = type(instance)
+    # One query for every slug that could collide. Suffixed candidates may cut into the
+    # end of `base`, so match on a prefix that leaves room for a suffix up to "-99999".
+    taken = set(
+        Model.objects.filter(_prefix_range(slug_field, base[: max_length - 6]))
+        .exclude(pk=instance.pk)
+        .order_by()
+        .values_list(slug_field, flat=True)
+    )
+    setattr(instance, slug_field, _free_slug(base, taken, max_length))
+
+
+def _prefix_range(field: str, prefix: str) -> models.Q:
+    """Rows whose `field` starts with `prefix`, as a range the field's index can seek.
+
+    `__startswith` compiles to LIKE, which SQLite cannot run on a (case-sensitive)
+    index, so it would scan the table.
+    """
+    return models.Q(**{f"{field}__gte": prefix, f"{field}__lt": prefix + "\U0010ffff"})
+
+
+def _free_slug(base: str, taken: set, max_length: int) -> str:
+    slug = base
     n = 2
-    while Model.objects.filter(**{slug_field: slug}).exclude(pk=instance.pk).exists():
+    while slug in taken:
         suffix = f"-{n}"
-        cut = (max_length or 240) - len(suffix)
+        cut = max_length - len(suffix)
         slug = f"{base[:cut]}{suffix}"
         n += 1
-    setattr(instance, slug_field, slug)
+    return slug
+
+
+def _bulk_create_with_slugs(model, objs, max_length: int, **kwargs):
+    """bulk_create ``objs`` after filling blank slugs from their titles.
+
+    bulk_create skips pre_save, so _pre_slug never runs; this resolves every
+    collision with one prefix query per 500 distinct titles instead of one per row.
+    """
+    objs = list(objs)
+    # unsaved instances are unhashable, so pair them up rather than keying a dict
+    pending = [
+        (obj, slugify(obj.title or "")[:max_length] or secrets.token_hex(4))
+        for obj in objs if not obj.slug
+    ]
+    taken = {obj.slug for obj in objs if obj.slug}
+    prefixes = sorted({base[: max_length - 6] for _, base in pending})
+    for i in range(0, len(prefixes), 500):
+        match = functools.reduce(operator.or_, (_prefix_range("slug", p) for p in prefixes[i:i + 500]))
+        taken.update(model.objects.filter(match).order_by().values_list("slug", flat=True))
+    for obj, base in pending:
+        obj.slug = _free_slug(base, taken, max_length)
+        taken.add(obj.slug)
+    return model.objects.bulk_create(objs, **kwargs)
 
 
 def _ensure_single_hod(sender, instance: StaffProfile, **kwargs):
-    if instance.is_hod or instance.role == StaffRole.HOD:
-        StaffProfile.objects.exclude(pk=instance.pk).filter(
-            models.Q(is_hod=True) | models.Q(role=StaffRole.HOD)
-        ).update(is_hod=False, role=StaffRole.PROFESSOR)
+    if not (instance.is_hod or instance.role == StaffRole.HOD):
+        return
+    is_current_hod = models.Q(is_hod=True) | models.Q(role=StaffRole.HOD)
+    # Re-saving the existing HoD (the usual admin edit): nobody else can hold the post.
+    was_hod = getattr(instance, "_loaded_hod", None)
+    if was_hod is None and instance.pk:
+        was_hod = StaffProfile.objects.filter(is_current_hod, pk=instance.pk).exists()
+    if was_hod:
+        return
+    StaffProfile.objects.filter(is_current_hod & ~models.Q(pk=instance.pk)).update(
+        is_hod=False, role=StaffRole.PROFESSOR
+    )
+
+
+
+def _remember_hod(sender, instance: StaffProfile, update_fields=None, **kwargs):
+    # keep from_db's snapshot in step with what this save wrote, so a HoD who stepped
+    # down is not later treated as the current one by _ensure_single_hod
+    if update_fields is None or {"is_hod", "role"} <= update_fields:
+        instance._loaded_hod = instance.is_hod or instance.role == StaffRole.HOD
+    elif {"is_hod", "role"} & update_fields:
+        instance._loaded_hod = None  # partly written: look it up next time
+
+
+def _delete_files(sender, instance, **kwargs):
+    # post_delete also fires for queryset/admin bulk deletes, which skip Model.delete()
+    _unlink_on_commit(*(
+        getattr(instance, f.attname) for f in sender._meta.concrete_fields
+        if isinstance(f, models.FileField)
+    ))
+
 
+def _pre_embed_url(sender, instance: Event, **kwargs):
+    instance.embed_url = _embed_url(instance.video_url) if instance.video_url else ""
 
 
 def _pre_slug(sender, instance, **kwargs):
@@ -513,6 +726,13 @@ def _pre_slug(sender, instance, **kwargs):
 
 # Connect signals
 pre_save.connect(_pre_slug, sender=Event)
+pre_save.connect(_pre_embed_url, sender=Event)
 pre_save.connect(_pre_slug, sender=News)
 pre_save.connect(_pre_slug, sender=Album)
 pre_save.connect(_ensure_single_hod, sender=StaffProfile)
+post_save.connect(_remember_hod, sender=StaffProfile)
+for _model in (
+    DepartmentSettings, Slider, AboutImage, HighlightCard, SectionImage, Exam,
+    ClassTimetable, Event, News, StaffProfile, Album, GalleryMedia,
+):
+    post_delete.connect(_delete_files, sender=_model)
@@ -0,0 +1,154 @@
+# main/paginators.py
+import hashlib
+import json
+from datetime import datetime
+
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.db.models import Q
+from django.utils.functional import cached_property
+from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
+
+
+def count_cache_key(request, queryset, param_name):
+    """CachedCountPaginator key for this list: model, path and every GET filter but the page.
+
+    Free-text searches (``?q=``) are narrow and rarely repeated, so they get no key and are
+    just counted.
+    """
+    if request.GET.get("q"):
+        return None
+    params = sorted((k, v) for k, v in request.GET.items() if k != param_name)
+    digest = hashlib.md5(repr(params).encode(), usedforsecurity=False).hexdigest()
+    return f"count:{queryset.model._meta.label_lower}:{request.path}:{digest}"
+
+
+class CachedCountPaginator(Paginator):
+    """
+    Paginator that caches its COUNT(*) for `count_timeout` seconds under
+    `count_cache_key`; without a key it counts as usual.
+    """
+    count_timeout = 60
+
+    def __init__(self, *args, count_cache_key=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.count_cache_key = count_cache_key
+
+    @cached_property
+    def count(self):
+        if self.count_cache_key is None:
+            return Paginator.count.func(self)
+        return cache.get_or_set(self.count_cache_key, lambda: Paginator.count.func(self), self.count_timeout)
+
+
+class PkSlicePaginator(CachedCountPaginator):
+    """
+    Paginator whose OFFSET runs over primary keys only.
+
+    The page is fetched as ``WHERE pk IN (SELECT pk ... LIMIT n OFFSET m)``, so the
+    skipped rows are walked on the pk/ordering columns instead of being read in full.
+    """
+
+    def page(self, number):
+        if not hasattr(self.object_list, "values"):
+            return super().page(number)
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+        window = self.object_list.values("pk")[bottom:top]
+        # object_list is already ordered, and filtering keeps that ordering
+        return self._get_page(self.object_list.filter(pk__in=window), number, self)
+
+
+class KeysetPage:
+    """One page from KeysetPaginator; exposes what the Prev/Next templates use."""
+
+    def __init__(self, object_list, number, next_cursor, previous_cursor):
+        self.object_list = object_list
+        self.number = number
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+
+class KeysetPaginator:
+    """
+    Cursor pagination over a queryset ordered by `ordering`, which must end in a
+    unique column (e.g. ("-published_at", "-id")) and should match an index.
+
+    Pages are fetched with a WHERE on the last/first row's sort key instead of
+    OFFSET, and without a COUNT(*). Cursors are opaque url-safe strings.
+    """
+
+    def __init__(self, object_list, per_page, ordering):
+        self.object_list = object_list
+        self.per_page = int(per_page)
+        self.ordering = tuple(ordering)
+        self._fields = [(f.lstrip("-"), f.startswith("-")) for f in self.ordering]
+
+    def page(self, cursor=None):
+        number, forward, values = self._decode(cursor) if cursor else (1, True, None)
+        qs = self.object_list.order_by(*self.ordering)
+        if not forward:
+            qs = qs.reverse()
+        if values is not None:
+            qs = qs.filter(self._seek(values, forward))
+        rows = list(qs[: self.per_page + 1])
+        more = len(rows) > self.per_page
+        rows = rows[: self.per_page]
+        if not forward:
+            rows.reverse()
+
+        # going forward, "more" means a next page; going back, a previous one
+        has_next = more if forward else True
+        has_previous = number > 1 if forward else more
+        next_cursor = self._encode(number + 1, True, rows[-1]) if rows and has_next else None
+        previous_cursor = None
+        if rows and has_previous:
+            # page 1 is plain (no cursor), so its link is the empty string
+            previous_cursor = self._encode(number - 1, False, rows[0]) if number > 2 else ""
+        return KeysetPage(rows, number, next_cursor, previous_cursor)
+
+    def _seek(self, values, forward):
+        # (a, b) after (x, y) in ("-a", "b") order: a < x OR (a = x AND b > y)
+        q = Q()
+        equal = {}
+        for (name, desc), value in zip(self._fields, values):
+            op = "lt" if desc == forward else "gt"
+            q |= Q(**equal, **{f"{name}__{op}": value})
+            equal[name] = value
+        return q
+
+    def _encode(self, number, forward, obj):
+        values = [getattr(obj, name) for name, _ in self._fields]
+        payload = [number, forward, [v.isoformat() if isinstance(v, datetime) else v for v in values]]
+        return urlsafe_base64_encode(json.dumps(payload, separators=(",", ":")).encode())
+
+    def _decode(self, cursor):
+        try:
+            number, forward, raw = json.loads(urlsafe_base64_decode(cursor))
+            if len(raw) != len(self._fields) or int(number) < 1:
+                raise ValueError
+            opts = self.object_list.model._meta
+            values = [opts.get_field(name).to_python(v) for (name, _), v in zip(self._fields, raw)]
+        except (TypeError, ValueError, ValidationError):
+            # tampered or stale cursor: start over
+            return 1, True, None
+        return int(number), bool(forward), values
@@ -0,0 +1,41 @@
+# main/search.py
+"""
+Full-text lookup for the news search box.
+
+On SQLite, migration 0015 keeps a trigram FTS5 index (main_news_fts) over
+News.title/summary/body in sync with triggers. A trigram MATCH is a
+case-insensitive substring match like icontains, but is answered from the
+index instead of scanning every body. Other databases, queries shorter than
+a trigram, and trees where the index or its triggers are missing (a later
+migration that rebuilds main_news drops its triggers) use icontains.
+"""
+import functools
+
+from django.db import connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+NEWS_FTS_TABLE = "main_news_fts"
+_NEWS_FTS_OBJECTS = {NEWS_FTS_TABLE, f"{NEWS_FTS_TABLE}_ai", f"{NEWS_FTS_TABLE}_ad", f"{NEWS_FTS_TABLE}_au"}
+
+
+@functools.lru_cache(maxsize=1)
+def _news_fts_ready() -> bool:
+    if connection.vendor != "sqlite":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE name IN (%s)" % ", ".join(["%s"] * len(_NEWS_FTS_OBJECTS)),
+            sorted(_NEWS_FTS_OBJECTS),
+        )
+        return {row[0] for row in cursor.fetchall()} == _NEWS_FTS_OBJECTS
+
+
+def search_news(queryset, q: str):
+    """Filter a News queryset to rows whose title, summary or body contain `q`."""
+    if len(q) >= 3 and _news_fts_ready():
+        phrase = '"%s"' % q.replace('"', '""')
+        return queryset.filter(
+            pk__in=RawSQL(f"SELECT rowid FROM {NEWS_FTS_TABLE} WHERE {NEWS_FTS_TABLE} MATCH %s", [phrase])
+        )
+    return queryset.filter(Q(title__icontains=q) | Q(summary__icontains=q) | Q(body__icontains=q))
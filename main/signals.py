@@ -0,0 +1,62 @@
+# main/signals.py
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import cache_keys
+from .models import (
+    AboutImage, ClassTimetable, DepartmentSettings, Event, Exam, GalleryMedia, HighlightCard, News,
+    SectionImage, Slider,
+)
+
+
+@receiver(post_save, sender=DepartmentSettings)
+@receiver(post_delete, sender=DepartmentSettings)
+def _clear_department_settings_cache(sender, **kwargs):
+    cache.delete_many([
+        cache_keys.DEPARTMENT_SETTINGS, cache_keys.DEPARTMENT_SETTINGS_EXISTS, cache_keys.COMMON_CONTEXT,
+    ])
+
+
+@receiver(post_save, sender=AboutImage)
+@receiver(post_delete, sender=AboutImage)
+def _clear_about_image_cache(sender, **kwargs):
+    cache.delete_many([cache_keys.ABOUT_IMAGE_EXISTS, cache_keys.COMMON_CONTEXT])
+
+
+@receiver(post_save, sender=SectionImage)
+@receiver(post_delete, sender=SectionImage)
+def _clear_section_image_cache(sender, **kwargs):
+    cache.delete_many([cache_keys.SECTION_IMAGES, cache_keys.COMMON_CONTEXT])
+
+
+@receiver(post_save, sender=HighlightCard)
+@receiver(post_delete, sender=HighlightCard)
+def _clear_highlight_card_cache(sender, **kwargs):
+    cache.delete(cache_keys.COMMON_CONTEXT)
+
+
+@receiver(post_save, sender=Slider)
+@receiver(post_delete, sender=Slider)
+@receiver(post_save, sender=Exam)
+@receiver(post_delete, sender=Exam)
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+@receiver(post_save, sender=News)
+@receiver(post_delete, sender=News)
+@receiver(post_save, sender=GalleryMedia)
+@receiver(post_delete, sender=GalleryMedia)
+def _clear_home_cache(sender, **kwargs):
+    cache.delete(cache_keys.HOME_CONTEXT)
+
+
+@receiver(post_save, sender=GalleryMedia)
+@receiver(post_delete, sender=GalleryMedia)
+def _clear_gallery_years_cache(sender, **kwargs):
+    cache.delete(cache_keys.GALLERY_YEARS)
+
+
+@receiver(post_save, sender=ClassTimetable)
+@receiver(post_delete, sender=ClassTimetable)
+def _clear_timetable_years_cache(sender, **kwargs):
+    cache.delete(cache_keys.TIMETABLE_YEARS)
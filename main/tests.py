@@ -0,0 +1,215 @@
+import json
+import tempfile
+from datetime import date, timedelta
+
+from django.conf import settings
+from django.contrib import admin
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import Client, RequestFactory, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import urlsafe_base64_encode
+
+from . import cache_keys
+from .models import (
+    Album, DepartmentSettings, Exam, GalleryMedia, News, StaffProfile, StaffRole, _free_slug,
+)
+from .paginators import KeysetPaginator
+from .views import _build_home_context, _split_at
+
+# per-test-process cache, so runs never read or clear the shared site cache
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=LOCMEM_CACHES, MEDIA_ROOT=tempfile.gettempdir())
+class AlbumDeleteWithMediaTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_clears_home_and_gallery_caches(self):
+        album = Album.objects.create(title="Sports Day")
+        photo = GalleryMedia.objects.create(album=album, image="gallery/photos/missing.jpg", year=2024)
+        home = cache.get_or_set(cache_keys.HOME_CONTEXT, _build_home_context)
+        self.assertEqual(home["gallery_photos"], [photo])
+        cache.set(cache_keys.GALLERY_YEARS, [2024])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            album.delete_with_media()
+
+        self.assertIsNone(album.pk)
+        self.assertFalse(GalleryMedia.objects.exists())
+        self.assertIsNone(cache.get(cache_keys.GALLERY_YEARS))
+        home = cache.get_or_set(cache_keys.HOME_CONTEXT, _build_home_context)
+        self.assertEqual(home["gallery_photos"], [])
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class SlugHelperTests(TestCase):
+    def test_free_slug_returns_base_when_unused(self):
+        self.assertEqual(_free_slug("open-day", {"open-day-2"}, 240), "open-day")
+
+    def test_free_slug_takes_first_free_suffix(self):
+        self.assertEqual(_free_slug("open-day", {"open-day", "open-day-2"}, 240), "open-day-3")
+
+    def test_free_slug_truncates_base_to_fit_suffix(self):
+        base = "a" * 10
+        slug = _free_slug(base, {base}, 10)
+        self.assertEqual(slug, "a" * 8 + "-2")
+
+    def test_bulk_create_with_slugs(self):
+        News.objects.create(title="Annual Day")
+        objs = [
+            News(title="Annual Day"),
+            News(title="Annual Day", slug="annual-day-3"),
+            News(title="Annual Day"),
+            News(title=""),
+        ]
+        # one prefix query for the existing slugs, one INSERT
+        with self.assertNumQueries(2):
+            News.bulk_create_with_slugs(objs)
+        self.assertEqual(
+            [o.slug for o in objs[:3]], ["annual-day-2", "annual-day-3", "annual-day-4"]
+        )
+        self.assertRegex(objs[3].slug, r"^[0-9a-f]{8}$")
+        self.assertEqual(News.objects.filter(slug__startswith="annual-day").count(), 4)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class KeysetPaginatorTests(TestCase):
+    ordering = ("-created_at", "-id")
+
+    def setUp(self):
+        GalleryMedia.objects.bulk_create(GalleryMedia(caption=str(i)) for i in range(7))
+        # every row shares one created_at, so only the id tie-breaker orders them
+        GalleryMedia.objects.update(created_at=timezone.now())
+        self.ids = list(GalleryMedia.objects.order_by("-id").values_list("id", flat=True))
+        self.paginator = KeysetPaginator(GalleryMedia.objects.all(), 3, self.ordering)
+
+    def ids_of(self, page):
+        return [obj.id for obj in page]
+
+    def test_walks_forward_and_back_through_tied_rows(self):
+        first = self.paginator.page()
+        self.assertEqual(self.ids_of(first), self.ids[0:3])
+        self.assertIsNone(first.previous_cursor)
+
+        second = self.paginator.page(first.next_cursor)
+        self.assertEqual((second.number, self.ids_of(second)), (2, self.ids[3:6]))
+        self.assertEqual(second.previous_cursor, "")  # page 1 has no cursor
+
+        third = self.paginator.page(second.next_cursor)
+        self.assertEqual((third.number, self.ids_of(third)), (3, self.ids[6:]))
+        self.assertFalse(third.has_next())
+
+        back = self.paginator.page(third.previous_cursor)
+        self.assertEqual((back.number, self.ids_of(back)), (2, self.ids[3:6]))
+        self.assertTrue(back.has_next())
+        self.assertEqual(self.ids_of(self.paginator.page(back.next_cursor)), self.ids[6:])
+
+    def test_tampered_cursor_restarts_at_first_page(self):
+        def encode(payload):
+            return urlsafe_base64_encode(json.dumps(payload).encode())
+
+        for cursor in (
+            "not-a-cursor",
+            encode([2, True, [1]]),  # wrong number of values
+            encode([2, True, ["yesterday", 1]]),  # not a datetime
+            encode([0, True, ["2024-01-01T00:00:00+00:00", 1]]),  # page number below 1
+        ):
+            with self.subTest(cursor=cursor):
+                page = self.paginator.page(cursor)
+                self.assertEqual((page.number, self.ids_of(page)), (1, self.ids[0:3]))
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class SplitAtTests(TestCase):
+    pivot = date(2025, 3, 10)
+
+    def add_exam(self, days, semester=1):
+        return Exam.objects.create(
+            title=f"{days}/{semester}", course="BCA", semester=semester,
+            exam_date=self.pivot + timedelta(days=days),
+        )
+
+    def test_nearest_rows_on_each_side_in_one_query(self):
+        exams = {days: self.add_exam(days) for days in range(-4, 5)}
+        with self.assertNumQueries(1):
+            upcoming, past = _split_at(Exam.objects.all(), "exam_date", self.pivot, 3)
+        # the pivot itself counts as upcoming; past runs nearest first
+        self.assertEqual(upcoming, [exams[0], exams[1], exams[2]])
+        self.assertEqual(past, [exams[-1], exams[-2], exams[-3]])
+
+    def test_then_by_orders_ties_within_each_side(self):
+        later = self.add_exam(2, semester=3)
+        earlier = self.add_exam(2, semester=1)
+        past = self.add_exam(-1, semester=5)
+        upcoming, before = _split_at(Exam.objects.all(), "exam_date", self.pivot, 5, then_by=("semester",))
+        self.assertEqual(upcoming, [earlier, later])
+        self.assertEqual(before, [past])
+
+    def test_empty_sides(self):
+        self.assertEqual(_split_at(Exam.objects.all(), "exam_date", self.pivot, 3), ([], []))
+        only_past = self.add_exam(-2)
+        self.assertEqual(_split_at(Exam.objects.all(), "exam_date", self.pivot, 3), ([], [only_past]))
+
+
+@override_settings(
+    CACHES=LOCMEM_CACHES,
+    STATICFILES_STORAGE="django.contrib.staticfiles.storage.StaticFilesStorage",
+)
+class PublicPageCsrfTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_cached_news_page_still_sets_csrf_cookie(self):
+        first = Client(enforce_csrf_checks=True)
+        self.assertIn(settings.CSRF_COOKIE_NAME, first.get(reverse("news")).cookies)
+
+        # a second cookie-less visitor must get its own cookie, not the first one's cached token
+        second = Client(enforce_csrf_checks=True)
+        response = second.get(reverse("news"))
+        self.assertIn(settings.CSRF_COOKIE_NAME, response.cookies)
+        token = response.cookies[settings.CSRF_COOKIE_NAME].value
+        response = second.post(
+            reverse("news"), {"subscribe_email": "a@example.com", "csrfmiddlewaretoken": token}
+        )
+        self.assertEqual(response.status_code, 200)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class SingleHodTests(TestCase):
+    def test_former_hod_can_take_the_post_back(self):
+        StaffProfile.objects.create(name="A", role=StaffRole.PROFESSOR, is_hod=True)
+        a = StaffProfile.objects.get(name="A")
+        a.is_hod = False
+        a.save()
+        b = StaffProfile.objects.create(name="B", role=StaffRole.PROFESSOR, is_hod=True)
+
+        # `a` was loaded as HoD; the save above must not leave it looking like one
+        a.is_hod = True
+        a.save()
+
+        b.refresh_from_db()
+        self.assertFalse(b.is_hod)
+        self.assertEqual(list(StaffProfile.objects.filter(is_hod=True)), [a])
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class SingletonAdminTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.request = RequestFactory().get("/admin/")
+        self.request.user = User.objects.create_superuser("admin", "admin@example.com", "pw")
+        self.model_admin = admin.site._registry[DepartmentSettings]
+
+    def test_add_permission_follows_saves_and_deletes(self):
+        self.assertTrue(self.model_admin.has_add_permission(self.request))
+        row = DepartmentSettings.objects.create(site_name="CS")
+        # the cached "no row yet" flag is cleared by the save
+        with self.assertNumQueries(1):
+            self.assertFalse(self.model_admin.has_add_permission(self.request))
+        with self.assertNumQueries(0):
+            self.assertFalse(self.model_admin.has_add_permission(self.request))
+        row.delete()
+        self.assertTrue(self.model_admin.has_add_permission(self.request))
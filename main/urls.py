@@ -1,6 +1,25 @@
-from django.urls import path
+from django.urls import include, path
 from . import views
 
+# Multi-route sections are grouped under their prefix, so a request for one
+# section never tries the other sections' patterns. Names stay un-namespaced.
+event_urls = [
+path("", views.events, name="events"),
+path("<slug:slug>/", views.event_detail, name="event_detail"),
+]
+
+news_urls = [
+path("", views.news, name="news"),
+path("<slug:slug>/", views.news_detail, name="news_detail"),
+]
+
+gallery_urls = [
+path("", views.gallery, name="gallery"),
+path("admin/", views.gallery_admin, name="gallery_admin"),   # ✅ added
+path("upload/", views.upload_media, name="upload_media"),   # ✅ added
+path("album/<slug:slug>/", views.album_detail, name="album_detail"),  # ✅ added
+]
+
 urlpatterns = [
 # ---------------- Home & About ----------------
 path("", views.home, name="home"),
@@ -9,8 +28,7 @@ path("staff/", views.staff, name="staff"),
 
 
 # ---------------- Events ----------------
-path("events/", views.events, name="events"),
-path("events/<slug:slug>/", views.event_detail, name="event_detail"),
+path("events/", include(event_urls)),
 
 # ---------------- Exams ----------------
 path("exams/", views.exams, name="exams"),
@@ -18,14 +36,10 @@ path("exams/", views.exams, name="exams"),
 path("timetables/", views.timetables, name="timetables"),
 
 # ---------------- News ----------------
-path("news/", views.news, name="news"),
-path("news/<slug:slug>/", views.news_detail, name="news_detail"),
+path("news/", include(news_urls)),
 
 # ---------------- Gallery ----------------
-path("gallery/", views.gallery, name="gallery"),
-path("gallery/admin/", views.gallery_admin, name="gallery_admin"),   # ✅ added
-path("gallery/upload/", views.upload_media, name="upload_media"),   # ✅ added
-path("gallery/album/<slug:slug>/", views.album_detail, name="album_detail"),  # ✅ added
+path("gallery/", include(gallery_urls)),
 
 # ---------------- Contact ----------------
 path("contact/", views.contact, name="contact"),
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from typing import Optional
-from math import ceil
+from urllib.parse import urlencode
 
 from django.contrib import messages
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
-from django.db.models import Q
+from django.core.cache import cache
+from django.core.paginator import EmptyPage, PageNotAnInteger
+from django.db.models import BooleanField, Case, ExpressionWrapper, F, Q, When, Window
+from django.db.models.functions import RowNumber
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.utils import timezone
@@ -14,42 +16,83 @@ from django.utils import timezone
 # New imports for admin/login decorators
 from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth.decorators import login_required
+from django.views.decorators.cache import cache_page
+from django.views.decorators.csrf import csrf_protect
+from django.views.decorators.vary import vary_on_cookie
 
+from . import cache_keys
 from .models import (
     ContactMessage,
-    DepartmentSettings,
     Event,
     Exam,
     News,
     NewsCategory,
+    NEWS_CATEGORY_CHOICES,
     StaffProfile,
     StaffRole,
     Slider,
-    AboutImage,
     GalleryMedia,   # ✅ gallery model
     Album,          # ✅ album model
-    HighlightCard,
-    SectionImage,
     ClassTimetable,  # ← ADDED so timetables() can use the model
 )
+from .paginators import KeysetPaginator, PkSlicePaginator, count_cache_key
+from .search import search_news
+
+
+# Anonymous GET pages are cached whole for a minute, keyed on the full URL. Vary: Cookie
+# (applied inside cache_page so it is on the response cache_page stores) keeps
+# logged-in users, flash messages and CSRF-bearing pages out of the shared entries.
+# csrf_protect sits inside cache_page too: the middleware only sets the CSRF cookie after
+# cache_page has stored the response, so a page with {% csrf_token %} (news) would be
+# cached with the first visitor's token and no Set-Cookie. Run inside, it sets the cookie
+# first, and cache_page does not store cookie-setting responses to cookie-less requests.
+def _public_page(view):
+    return cache_page(60)(csrf_protect(vary_on_cookie(view)))
+
+
+# staff page tabs
+_FACULTY_ROLES = frozenset({StaffRole.HOD, StaffRole.PROFESSOR, StaffRole.ASSOCIATE, StaffRole.ASSISTANT})
+_SUPPORT_ROLES = frozenset({StaffRole.INSTRUCTOR, StaffRole.TECH, StaffRole.SUPPORT})
+# news filter dropdown: every category, no DISTINCT query
+_NEWS_CATEGORIES = tuple(value for value, _label in NEWS_CATEGORY_CHOICES)
 
 
 # -----------------------
 # Small helpers
 # -----------------------
 
-def _parse_date(value: Optional[str]) -> Optional[datetime]:
-    if not value:
+def _parse_day(value: Optional[str]) -> Optional[date]:
+    # YYYY-MM-DD only (what <input type="date"> sends); the length check skips
+    # the exception path for most junk input
+    if not value or len(value) != 10:
         return None
     try:
-        dt = datetime.strptime(value, "%Y-%m-%d")
-        return timezone.make_aware(dt)
-    except Exception:
+        return date.fromisoformat(value)
+    except ValueError:
         return None
 
 
+def _parse_date(value: Optional[str]) -> Optional[datetime]:
+    d = _parse_day(value)
+    if d is None:
+        return None
+    return timezone.make_aware(datetime(d.year, d.month, d.day))
+
+
+def _filters(request: HttpRequest) -> dict:
+    """Non-blank GET parameters, stripped, read in one pass (unfiltered pages give {})."""
+    return {k: v for k, v in ((k, v.strip()) for k, v in request.GET.items()) if v}
+
+
+def _next_day(dt: datetime) -> datetime:
+    """Midnight after the aware local midnight `dt` (DST-safe), for half-open date ranges."""
+    return timezone.make_aware(timezone.make_naive(dt) + timedelta(days=1))
+
+
 def _paginate(request: HttpRequest, queryset, per_page: int = 9, param_name: str = "page"):
-    paginator = Paginator(queryset, per_page)
+    paginator = PkSlicePaginator(
+        queryset, per_page, count_cache_key=count_cache_key(request, queryset, param_name)
+    )
     page = request.GET.get(param_name)
     try:
         page_obj = paginator.page(page)
@@ -60,88 +103,77 @@ def _paginate(request: HttpRequest, queryset, per_page: int = 9, param_name: str
     return page_obj, page_obj.object_list
 
 
-def _repeat_for_scroll(items: list, min_items: int = 8) -> list:
-    """Repeat the list until its length >= min_items."""
-    if not items:
-        return []
-    repeats = ceil(min_items / len(items))
-    return items * repeats
+def _paginate_keyset(request: HttpRequest, queryset, ordering, per_page: int = 9, param_name: str = "cursor"):
+    """Like _paginate, but seeks by `ordering` (cursor in ?cursor=) instead of OFFSET/COUNT."""
+    page_obj = KeysetPaginator(queryset, per_page, ordering).page(request.GET.get(param_name))
+    return page_obj, page_obj.object_list
 
 
-def _common_context() -> dict:
+def _split_at(queryset, field: str, pivot, limit: int, then_by: tuple = ()):
     """
-    Return department settings, about image, bottom image and highlight cards for all templates.
-
-    - about_image: prefers SectionImage with key='about', else latest SectionImage,
-      else AboutImage fallback.
-    - bottom_image: prefers SectionImage with key='bottom', else next most recent SectionImage.
-    - highlight_cards: only active cards that have an image.
+    Rows on each side of `pivot` in one query: up to `limit` with field >= pivot in
+    ascending order, and up to `limit` before it, nearest first.
     """
-    ctx = {
-        "department_settings": DepartmentSettings.objects.first(),
-        "about_image": AboutImage.objects.order_by("-created_at").first(),
-    }
-
-    try:
-        # 1. Try by explicit keys
-        about_section = SectionImage.objects.filter(key="about").order_by("-created_at").first()
-        bottom_section = SectionImage.objects.filter(key="bottom").order_by("-created_at").first()
-
-        # 2. Fallbacks: latest SectionImages
-        if not about_section:
-            about_section = SectionImage.objects.order_by("-created_at").first()
-        if not bottom_section:
-            bottom_section = (
-                SectionImage.objects.exclude(pk=getattr(about_section, "pk", None))
-                .order_by("-created_at")
-                .first()
+    ahead = Q(**{f"{field}__gte": pivot})
+    rows = list(
+        queryset.annotate(
+            _side_rank=Window(
+                RowNumber(),
+                partition_by=[ExpressionWrapper(ahead, output_field=BooleanField())],
+                # each side has NULL for the other side's key, so only its own key orders it
+                order_by=[
+                    Case(When(ahead, then=F(field))).asc(),
+                    Case(When(~ahead, then=F(field))).desc(),
+                    *then_by,
+                ],
             )
-    except Exception:
-        about_section = None
-        bottom_section = None
-
-    ctx["about_image"] = about_section or ctx["about_image"]
-    ctx["bottom_image"] = bottom_section
-
-    try:
-        cards_qs = list(
-            HighlightCard.objects.filter(is_active=True)
-            .exclude(image__isnull=True)
-            .exclude(image__exact="")
-            .order_by("order", "-created_at")
         )
-    except Exception:
-        cards_qs = []
+        .filter(_side_rank__lte=limit)
+        .order_by(field, *then_by)
+    )
+    split = next((i for i, row in enumerate(rows) if getattr(row, field) >= pivot), len(rows))
+    return rows[split:], rows[:split][::-1]
+
 
-    ctx["highlight_cards"] = _repeat_for_scroll(cards_qs, min_items=8)
-    return ctx
+def _querystring_without(request: HttpRequest, param_name: str) -> str:
+    """Current GET params minus `param_name`, as "&..." for appending to pager links."""
+    pairs = [(k, v) for k, values in request.GET.lists() if k != param_name for v in values]
+    return "&" + urlencode(pairs) if pairs else ""
 
 
 # -----------------------
 # Home
 # -----------------------
 
-def home(request: HttpRequest) -> HttpResponse:
+def _build_home_context() -> dict:
+    """Home page blocks; cached by home() and cleared by main.signals when their models change."""
     now = timezone.now()
 
-    sliders = Slider.objects.filter(is_active=True).order_by("-created_at")[:8]
-    next_exam = Exam.objects.filter(exam_date__gte=now.date()).order_by("exam_date", "semester").first()
-    upcoming_event = Event.objects.filter(start_at__gte=now).order_by("start_at").first()
-    latest_news = News.objects.order_by("-published_at", "-id").first()
-    news_list = News.objects.order_by("-published_at", "-id")[:6]
-    events_home = Event.objects.filter(start_at__gte=now).order_by("start_at")[:3]
-    gallery_photos = GalleryMedia.objects.filter(media_type="photo").order_by("-created_at", "-id")[:8]
+    sliders = list(Slider.objects.filter(is_active=True).order_by("-created_at")[:8])
+    # the exam card reads title, date and pdf_file.url only
+    next_exam = (
+        Exam.objects.only("id", "title", "exam_date", "pdf_file")
+        .filter(exam_date__gte=now.date()).order_by("exam_date", "semester").first()
+    )
+    news_list = list(News.objects.defer("body").order_by("-published_at", "-id")[:6])
+    events_home = list(Event.objects.defer("description").filter(start_at__gte=now).order_by("start_at")[:3])
+    gallery_photos = list(GalleryMedia.objects.filter(media_type="photo").order_by("-created_at", "-id")[:8])
 
-    context = {
+    return {
         "sliders": sliders,
         "next_exam": next_exam,
-        "upcoming_event": upcoming_event,
-        "latest_news": latest_news,
+        # first rows of the lists above, so no separate queries
+        "upcoming_event": events_home[0] if events_home else None,
+        "latest_news": news_list[0] if news_list else None,
         "news_list": news_list,
         "events_home": events_home,
         "gallery_photos": gallery_photos,
     }
-    context.update(_common_context())
+
+
+@_public_page
+def home(request: HttpRequest) -> HttpResponse:
+    context = dict(cache.get_or_set(cache_keys.HOME_CONTEXT, _build_home_context, timeout=120))
     return render(request, "main/home.html", context)
 
 
@@ -149,14 +181,15 @@ def home(request: HttpRequest) -> HttpResponse:
 # About
 # -----------------------
 
+@_public_page
 def about(request: HttpRequest) -> HttpResponse:
-    context = _common_context()
-    return render(request, "main/about.html", context)
+    return render(request, "main/about.html")
 
 
 # -----------------------
 # Staff
 # -----------------------
+@_public_page
 def staff(request: HttpRequest) -> HttpResponse:
     """
     Staff listing view.
@@ -164,10 +197,14 @@ def staff(request: HttpRequest) -> HttpResponse:
     - Shows ALL staff, ordered by the admin-defined `order` field.
     - Still keeps extra context if you want to use tabs later (hod_list, faculty, support).
     """
-    q = request.GET.get("q", "").strip()
-    role = request.GET.get("role", "").strip()
+    params = _filters(request)
+    q = params.get("q", "")
+    role = params.get("role", "")
 
-    staff_qs = StaffProfile.objects.all()
+    # list columns only; bio and the other long profile fields are never rendered here
+    staff_qs = StaffProfile.objects.only(
+        "id", "name", "role", "designation", "email", "phone", "photo", "order", "is_hod"
+    )
 
     # filters
     if q:
@@ -184,32 +221,37 @@ def staff(request: HttpRequest) -> HttpResponse:
     # strict ordering by admin "order" field
     staff_qs = staff_qs.order_by("order", "role", "name")
 
-    # subsets (optional – you can remove if you don’t use tabs)
-    hod_list = staff_qs.filter(Q(is_hod=True) | Q(role=StaffRole.HOD))
-    faculty = staff_qs.filter(role__in=[StaffRole.HOD, StaffRole.PROFESSOR, StaffRole.ASSOCIATE, StaffRole.ASSISTANT])
-    support = staff_qs.filter(role__in=[StaffRole.INSTRUCTOR, StaffRole.TECH, StaffRole.SUPPORT])
+    # subsets (optional – you can remove if you don’t use tabs), split from one query
+    all_staff = list(staff_qs)
+    hod_list = [s for s in all_staff if s.is_hod or s.role == StaffRole.HOD]
+    faculty = [s for s in all_staff if s.role in _FACULTY_ROLES]
+    support = [s for s in all_staff if s.role in _SUPPORT_ROLES]
 
     context = {
-        "all_staff": staff_qs,   # ✅ this will include everyone
+        "all_staff": all_staff,   # ✅ this will include everyone
         "hod_list": hod_list,
         "faculty": faculty,
         "support": support,
     }
-    context.update(_common_context())
     return render(request, "main/staff.html", context)
 
 # -----------------------
 # Events
 # -----------------------
 
+@_public_page
 def events(request: HttpRequest) -> HttpResponse:
     now = timezone.now()
-    q = request.GET.get("q", "").strip()
-    type_ = request.GET.get("type", "").strip()
-    dfrom = _parse_date(request.GET.get("from"))
-    dto = _parse_date(request.GET.get("to"))
-
-    base = Event.objects.all()
+    params = _filters(request)
+    q = params.get("q", "")
+    type_ = params.get("type", "")
+    dfrom = _parse_date(params.get("from"))
+    dto = _parse_date(params.get("to"))
+
+    base = Event.objects.only(
+        "id", "slug", "title", "short_description", "category", "start_at", "end_at", "venue",
+        "image", "video", "video_url", "embed_url",
+    )
 
     if q:
         base = base.filter(
@@ -221,26 +263,24 @@ def events(request: HttpRequest) -> HttpResponse:
     if type_:
         base = base.filter(category=type_)
     if dfrom:
-        base = base.filter(start_at__date__gte=dfrom.date())
+        base = base.filter(start_at__gte=dfrom)
     if dto:
-        base = base.filter(start_at__date__lte=dto.date())
+        base = base.filter(start_at__lt=_next_day(dto))
 
-    upcoming = base.filter(start_at__gte=now).order_by("start_at")
-    past = base.filter(start_at__lt=now).order_by("-start_at")
+    upcoming, past = _split_at(base, "start_at", now, 18)
 
     context = {
-        "events_upcoming": list(upcoming[:18]),
-        "events_past": list(past[:18]),
+        "events_upcoming": upcoming,
+        "events_past": past,
     }
-    context.update(_common_context())
     return render(request, "main/events.html", context)
 
 
+@_public_page
 def event_detail(request: HttpRequest, slug: str) -> HttpResponse:
     obj = get_object_or_404(Event, slug=slug)
-    related = Event.objects.filter(category=obj.category).exclude(pk=obj.pk).order_by("-start_at")[:4]
+    related = Event.objects.defer("description").filter(category=obj.category).exclude(pk=obj.pk).order_by("-start_at")[:4]
     context = {"event": obj, "related": related}
-    context.update(_common_context())
     return render(request, "main/event_detail.html", context)
 
 
@@ -248,10 +288,12 @@ def event_detail(request: HttpRequest, slug: str) -> HttpResponse:
 # Exams
 # -----------------------
 
+@_public_page
 def exams(request: HttpRequest) -> HttpResponse:
-    q = request.GET.get("q", "").strip()
-    semester = request.GET.get("semester", "").strip()
-    dfrom_raw = request.GET.get("from", "").strip()
+    params = _filters(request)
+    q = params.get("q", "")
+    semester = params.get("semester", "")
+    dfrom_raw = params.get("from", "")
 
     exams_qs = Exam.objects.all()
 
@@ -262,30 +304,27 @@ def exams(request: HttpRequest) -> HttpResponse:
             exams_qs = exams_qs.filter(semester=int(semester))
         except ValueError:
             pass
-    if dfrom_raw:
-        try:
-            dfrom = datetime.strptime(dfrom_raw, "%Y-%m-%d").date()
-            exams_qs = exams_qs.filter(exam_date__gte=dfrom)
-        except Exception:
-            pass
+    dfrom = _parse_day(dfrom_raw)
+    if dfrom:
+        exams_qs = exams_qs.filter(exam_date__gte=dfrom)
 
     today = timezone.now().date()
-    upcoming = exams_qs.filter(exam_date__gte=today).order_by("exam_date", "semester")
-    past = exams_qs.filter(exam_date__lt=today).order_by("-exam_date")
+    upcoming, past = _split_at(exams_qs, "exam_date", today, 50, then_by=("semester",))
 
     context = {
-        "exams_upcoming": list(upcoming[:50]),
-        "exams_past": list(past[:50]),
+        "exams_upcoming": upcoming,
+        "exams_past": past,
         "semesters": list(range(1, 9)),
     }
-    context.update(_common_context())
     return render(request, "main/exams.html", context)
 
 
+@_public_page
 def timetables(request: HttpRequest) -> HttpResponse:
-    q = request.GET.get("q", "").strip()
-    semester = request.GET.get("semester", "").strip()
-    year = request.GET.get("year", "").strip()
+    params = _filters(request)
+    q = params.get("q", "")
+    semester = params.get("semester", "")
+    year = params.get("year", "")
 
     qs = ClassTimetable.objects.all()
 
@@ -304,9 +343,12 @@ def timetables(request: HttpRequest) -> HttpResponse:
     context = {
         "timetables": qs,
         "semesters": range(1, 9),
-        "years": list(ClassTimetable.objects.values_list("academic_year", flat=True).distinct()),
+        "years": cache.get_or_set(
+            cache_keys.TIMETABLE_YEARS,
+            lambda: list(ClassTimetable.objects.values_list("academic_year", flat=True).distinct()),
+            timeout=600,
+        ),
     }
-    context.update(_common_context())
     return render(request, "main/timetables.html", context)
 
 
@@ -314,37 +356,37 @@ def timetables(request: HttpRequest) -> HttpResponse:
 # News
 # -----------------------
 
+@_public_page
 def news(request: HttpRequest) -> HttpResponse:
-    q = request.GET.get("q", "").strip()
-    category = request.GET.get("category", "").strip()
-    dfrom_raw = request.GET.get("from", "").strip()
-    dto_raw = request.GET.get("to", "").strip()
+    params = _filters(request)
+    q = params.get("q", "")
+    category = params.get("category", "")
+    dfrom_raw = params.get("from", "")
+    dto_raw = params.get("to", "")
 
-    base = News.objects.all()
+    base = News.objects.only("id", "slug", "title", "summary", "category", "image", "published_at", "is_featured")
 
     if q:
-        base = base.filter(Q(title__icontains=q) | Q(summary__icontains=q) | Q(body__icontains=q))
+        base = search_news(base, q)
     if category:
         base = base.filter(category=category)
     if dfrom_raw:
         dfrom = _parse_date(dfrom_raw)
         if dfrom:
-            base = base.filter(published_at__date__gte=dfrom.date())
+            base = base.filter(published_at__gte=dfrom)
     if dto_raw:
         dto = _parse_date(dto_raw)
         if dto:
-            base = base.filter(published_at__date__lte=dto.date())
+            base = base.filter(published_at__lt=_next_day(dto))
 
     base = base.order_by("-published_at", "-id")
     featured = base.filter(is_featured=True).first() or base.first()
-    page_obj, news_items = _paginate(request, base, per_page=8)
+    page_obj, news_items = _paginate_keyset(request, base, ("-published_at", "-id"), per_page=8)
 
-    notices = News.objects.filter(category=NewsCategory.NOTICE).order_by("-published_at")[:6]
-    categories = list(News.objects.values_list("category", flat=True).distinct())
+    notices = News.objects.defer("body").filter(category=NewsCategory.NOTICE).order_by("-published_at")[:6]
+    categories = _NEWS_CATEGORIES
 
-    querydict = request.GET.copy()
-    querydict.pop("page", None)
-    qs = "&" + querydict.urlencode() if querydict else ""
+    qs = _querystring_without(request, "cursor")
 
     context = {
         "featured_news": featured,
@@ -354,15 +396,14 @@ def news(request: HttpRequest) -> HttpResponse:
         "categories": categories,
         "notices": notices,
     }
-    context.update(_common_context())
     return render(request, "main/news.html", context)
 
 
+@_public_page
 def news_detail(request: HttpRequest, slug: str) -> HttpResponse:
     obj = get_object_or_404(News, slug=slug)
-    recent = News.objects.exclude(pk=obj.pk).order_by("-published_at")[:6]
+    recent = News.objects.defer("body").exclude(pk=obj.pk).order_by("-published_at")[:6]
     context = {"item": obj, "recent": recent}
-    context.update(_common_context())
     return render(request, "main/news_detail.html", context)
 
 
@@ -370,10 +411,12 @@ def news_detail(request: HttpRequest, slug: str) -> HttpResponse:
 # Gallery ✅
 # -----------------------
 
+@_public_page
 def gallery(request):
-    q = request.GET.get("q", "").strip()
-    category = request.GET.get("category", "").strip()
-    year = request.GET.get("year", "").strip()
+    params = _filters(request)
+    q = params.get("q", "")
+    category = params.get("category", "")
+    year = params.get("year", "")
 
     items = GalleryMedia.objects.all()
 
@@ -390,21 +433,23 @@ def gallery(request):
     items = items.order_by("-created_at", "-id")
 
     categories = ["photo", "video"]
-    years = list(
-        GalleryMedia.objects.exclude(year__isnull=True)
-        .values_list("year", flat=True)
-        .distinct()
-        .order_by("-year")
+    years = cache.get_or_set(
+        cache_keys.GALLERY_YEARS,
+        lambda: list(
+            GalleryMedia.objects.exclude(year__isnull=True)
+            .values_list("year", flat=True)
+            .distinct()
+            .order_by("-year")
+        ),
+        timeout=600,
     )
 
     # include albums for the albums section in the template
     albums = Album.objects.order_by("-created_at").all()
 
-    page_obj, gallery_items = _paginate(request, items, per_page=18)
+    page_obj, gallery_items = _paginate_keyset(request, items, ("-created_at", "-id"), per_page=18)
 
-    querydict = request.GET.copy()
-    querydict.pop("page", None)
-    qs = "&" + querydict.urlencode() if querydict else ""
+    qs = _querystring_without(request, "cursor")
 
     context = {
         "gallery_items": gallery_items,
@@ -414,10 +459,10 @@ def gallery(request):
         "years": years,
         "albums": albums,
     }
-    context.update(_common_context())
     return render(request, "main/gallery.html", context)
 
 
+@_public_page
 def album_detail(request: HttpRequest, slug: str) -> HttpResponse:
     """
     Show a single album page with its media items (paginated).
@@ -425,17 +470,18 @@ def album_detail(request: HttpRequest, slug: str) -> HttpResponse:
     """
     album = get_object_or_404(Album, slug=slug)
 
-    q = request.GET.get("q", "").strip()
-    items_qs = album.media.all().order_by("-created_at", "-id")  # related_name="media"
+    params = _filters(request)
+    q = params.get("q", "")
+    # related_name="media"; the related manager already attaches `album` to each item,
+    # so drop GalleryMediaManager's default album join here
+    items_qs = album.media.select_related(None).order_by("-created_at", "-id")
 
     if q:
         items_qs = items_qs.filter(caption__icontains=q)
 
     page_obj, gallery_items = _paginate(request, items_qs, per_page=18)
 
-    querydict = request.GET.copy()
-    querydict.pop("page", None)
-    qs = "&" + querydict.urlencode() if querydict else ""
+    qs = _querystring_without(request, "page")
 
     context = {
         "album": album,
@@ -443,7 +489,6 @@ def album_detail(request: HttpRequest, slug: str) -> HttpResponse:
         "page_obj": page_obj,
         "querystring": qs,
     }
-    context.update(_common_context())
     return render(request, "main/album_detail.html", context)
 
 
@@ -461,7 +506,6 @@ def gallery_admin(request: HttpRequest) -> HttpResponse:
     context = {
         "message": "Gallery admin placeholder — implement create/edit UI here.",
     }
-    context.update(_common_context())
     return render(request, "main/gallery_admin.html", context)
 
 
@@ -477,7 +521,6 @@ def upload_media(request: HttpRequest) -> HttpResponse:
         return redirect("gallery")  # redirect to the non-namespaced URL name
 
     context = {}
-    context.update(_common_context())
     return render(request, "main/upload_media.html", context)
 
 
@@ -504,5 +547,4 @@ def contact(request: HttpRequest) -> HttpResponse:
         return redirect("contact")
 
     context = {"form": {}}
-    context.update(_common_context())
     return render(request, "main/contact.html", context)
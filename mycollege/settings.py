@@ -72,7 +72,7 @@ TEMPLATES = [
                 "django.template.context_processors.request",
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
-                "main.context_processors.department_settings",
+                "main.context_processors.common_context",
             ],
         },
     },
@@ -85,6 +85,25 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
+        # Keep each worker's connection for 10 minutes instead of reopening it per
+        # request, so main.db._tune_sqlite's PRAGMAs run once per connection.
+        "CONN_MAX_AGE": 600,
+        "CONN_HEALTH_CHECKS": True,
+    }
+}
+
+# -------------------------------------------------------------------------
+# Cache
+# -------------------------------------------------------------------------
+# Shared by every worker process on the host (the SQLite database already
+# ties the site to one host), so a signal that clears a key in one worker
+# is seen by all of them. The per-process default (LocMemCache) would keep
+# serving stale settings and images from the other workers.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": BASE_DIR / "django_cache",
+        "OPTIONS": {"MAX_ENTRIES": 1000},
     }
 }
 
@@ -113,6 +132,9 @@ STATIC_URL = "/static/"
 STATICFILES_DIRS = [BASE_DIR / "static"]
 STATIC_ROOT = BASE_DIR / "staticfiles"
 
+# Compresses at collectstatic time: gzip always, plus .br files when the
+# brotli package (whitenoise[brotli]) is installed. Hashed names from the
+# manifest are served with a far-future Cache-Control by WhiteNoise.
 STATICFILES_STORAGE = (
     "whitenoise.storage.CompressedManifestStaticFilesStorage"
 )